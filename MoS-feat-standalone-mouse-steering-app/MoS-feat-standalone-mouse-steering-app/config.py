@@ -20,6 +20,7 @@ APP_NAME = "MoS - Advanced Mouse Steering"
 DEFAULT_WINDOW_WIDTH = 650
 DEFAULT_WINDOW_HEIGHT = 750 # Adjusted for potentially more info with PyQt
 UI_REFRESH_RATE_MS = 16 # Roughly 60 FPS for UI updates, if polling or timed updates are used
+SENSITIVITY_APPLY_INTERVAL_MS = 50 # While dragging, the sensitivity slider value is passed to the logic at most this often
 
 # Theming (Placeholder - actual QSS might be more complex or in separate files)
 THEME_DARK = "dark"
@@ -34,12 +35,13 @@ LOG_LEVEL = "INFO"
 # pynput runs its listener in a separate thread, so it's non-blocking by nature.
 
 # physics/calculation settings
+STEERING_TICK_RATE_HZ = 250 # Rate at which the latest mouse position is processed (mouse events are coalesced)
 TIME_DELTA_MODE = "per_event" # "per_event" or "real_time". "per_event" is simpler for now.
-                              # "real_time" would require using time.perf_counter() for velocity/accel.
-
-# Add this to config.py after the other imports/constants
-try:
-    from PyQt6.QtCore import QObject, pyqtSignal
-    HAS_PYQT = True
-except ImportError:
-    HAS_PYQT = False
\ No newline at end of file
+                              # "real_time" uses time.perf_counter_ns() deltas for velocity/accel.
+
+# Detect PyQt6 without importing it; core_logic only loads Qt when building the QObject variant.
+import importlib.util
+HAS_PYQT = importlib.util.find_spec("PyQt6") is not None
+
+# Optional: JIT-compile the per-event steering math with Numba when it is installed (detected without importing it).
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
@@ -4,49 +4,136 @@ Handles mouse input, steering calculations, and vJoy output.
 """
 import math
 import time
-from collections import deque
+import threading
+import logging
+from typing import NamedTuple
 import pyvjoy
 from pynput import mouse as pynput_mouse
-from PyQt6.QtCore import QObject, pyqtSignal
-HAS_PYQT = True  # Assume PyQt is available for this example
-# Attempt to import Qt core for signals if this class were to become a QObject
-# For now, using a standard callback passed from the GUI.
-"""try:
-    from PyQt6.QtCore import QObject, pyqtSignal
-    HAS_PYQT = True
-except ImportError:
-    HAS_PYQT = False
-    # Define dummy QObject and pyqtSignal if PyQt6 is not available
-    # This allows the class structure to be defined, but signals won't work.
-    # The app will rely on HAS_PYQT to use callbacks if signals are not possible.
-    class QObject:
-        def __init__(self, parent=None): pass
-    class pyqtSignal:
-        def __init__(self, *args, **kwargs): pass
-        def emit(self, *args, **kwargs): pass"""
-
+# PyQt6 is only imported by _make_steering_cls when config.HAS_PYQT is set, so the CLI
+# test and headless use don't pay for loading Qt.
 
 import config # Import constants and settings
-
-# If SteeringLogic is to emit Qt signals, it should inherit from QObject.
-# For now, a callback approach is simpler to implement without full Qt event loop knowledge here.
-# If HAS_PYQT is True, one could define signals here:
-# data_updated_signal = pyqtSignal(dict)
-# status_updated_signal = pyqtSignal(str)
-# vjoy_status_signal = pyqtSignal(str)
-
-# In core_logic.py, change the SteeringLogic class definition to:
-class SteeringLogic(QObject if config.HAS_PYQT else object): # Inherit QObject if PyQt is available
+from config import MAX_VJOY_AXIS as _VMAX, MIN_VJOY_AXIS as _VMIN # Bound once for the hot path
+
+log = logging.getLogger("MoS.core")
+
+if config.HAS_NUMBA:
+    from numba import njit
+else:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit when Numba is not installed: returns the function unchanged."""
+        def decorator(func):
+            return func
+        return decorator
+
+# Samples between exact recomputations of the smoothing running sums (purges FP drift over long sessions)
+_SMOOTHING_RESYNC_INTERVAL = 1024
+
+class SteerUpdate(NamedTuple):
+    """Snapshot of the steering state sent to the GUI with data_updated."""
+    offset: float
+    raw_angle: float
+    smoothed_angle: float
+    total_accumulated_degrees: float
+    rotation_direction: str
+    angular_velocity: float
+    angular_acceleration: float
+    vjoy_axis_value: int
+    is_steering: bool
+
+# JOYSTICK_POSITION axis fields centered at startup. The struct starts zeroed, and the first
+# update() would otherwise report every axis but X at its minimum.
+_CENTERED_VJOY_AXES = ("wAxisX", "wAxisY", "wAxisZ", "wAxisXRot", "wAxisYRot", "wAxisZRot", "wSlider", "wDial")
+
+# Rotation direction names, indexed by the direction code returned from _step
+_ROTATION_DIRECTIONS = ("None", "Clockwise", "Counterclockwise")
+
+@njit(cache=True, fastmath=True)
+def _step(dx, dy, old_ux, old_uy, last_ux, last_uy, sx, sy, prev_smoothed, ang_vel, accum,
+          time_delta, max_deg, dir_thresh, center_thresh_sq, axis_scale, axis_offset, vjoy_min, vjoy_max):
+    """
+    Per-event steering math, kept free of Python objects so Numba can compile it in nopython mode.
+    (dx, dy) is the mouse offset from the screen center; (old_ux, old_uy) is the ring buffer sample
+    being evicted and (last_ux, last_uy) the newest one. Returns
+    (ux, uy, sx, sy, raw_angle, smoothed, ang_vel, ang_accel, accum, direction_code, axis_value, offset_sq).
+    """
+    offset_sq = dx * dx + dy * dy
+    raw_angle = math.degrees(math.atan2(dy, dx))
+
+    # O(1) moving average of unit vectors: swap the oldest sample out of the running sums.
+    if offset_sq > 0.0:
+        inv_r = 1.0 / math.sqrt(offset_sq) # Normalization still needs the length
+        ux = dx * inv_r
+        uy = dy * inv_r
+    else: # Mouse exactly on the center has no direction; repeat the newest sample
+        ux = last_ux
+        uy = last_uy
+    sx += ux - old_ux
+    sy += uy - old_uy
+    smoothed = math.degrees(math.atan2(sy, sx))
+
+    # Branchless wrap into [-180, 180]: IEEE remainder semantics (round-half-even), so exactly
+    # +/-180 stay as they are, like the old strict >180 / <-180 branches. Spelled out because
+    # Numba's nopython mode has no math.remainder.
+    delta_angle = smoothed - prev_smoothed
+    delta_angle -= 360.0 * round(delta_angle / 360.0)
+
+    # Velocity/Acceleration based on time_delta (can be per-event if time_delta=1)
+    new_ang_vel = delta_angle / time_delta
+    ang_accel = (new_ang_vel - ang_vel) / time_delta
+
+    if offset_sq < center_thresh_sq:
+        direction_code = 0
+    elif delta_angle > dir_thresh:
+        direction_code = 1
+        accum += abs(delta_angle)
+    elif delta_angle < -dir_thresh:
+        direction_code = 2
+        accum -= abs(delta_angle)
+    else:
+        direction_code = 0
+    # Compare-assign clamps: no min()/max() builtin calls when running as plain Python
+    if accum > max_deg:
+        accum = max_deg
+    elif accum < -max_deg:
+        accum = -max_deg
+
+    # Scale the accumulated angle to the vJoy axis range (precomputed affine transform)
+    axis_value = int(accum * axis_scale + axis_offset)
+    if axis_value > vjoy_max:
+        axis_value = vjoy_max
+    elif axis_value < vjoy_min:
+        axis_value = vjoy_min
+
+    return (ux, uy, sx, sy, raw_angle, smoothed, new_ang_vel, ang_accel, accum,
+            direction_code, axis_value, offset_sq)
+
+# Fixed attribute layout: the hot path's attribute loads/stores go through slot descriptors
+# instead of an instance __dict__ (the sip QObject wrapper keeps an empty one of its own).
+# Every attribute assigned on an instance must be listed here.
+_STEERING_SLOTS = (
+    "parent_gui_callback", "sensitivity", "max_degrees", "direction_change_threshold",
+    "mouse_center_threshold", "_mouse_center_threshold_sq", "_real_time_mode",
+    "_axis_scale", "_axis_offset",
+    "current_raw_angle", "previous_smoothed_angle", "total_accumulated_degrees",
+    "rotation_direction", "current_offset", "_current_offset_sq",
+    "angular_velocity", "angular_acceleration",
+    "screen_center_x", "screen_center_y",
+    "_angbuf_size", "_cosbuf", "_sinbuf", "_angidx", "_sx", "_sy", "_samples_since_resync",
+    "last_event_time",
+    "vjoy_device", "_vjoy_pos", "_vjoy_update", "_last_axis_value",
+    "mouse_listener", "_mouse_controller", "is_steering",
+    "_latest_xy", "_steer_thread", "_state_lock", "vjoy_status_message",
+    "_dirty", "_ui_timer", "_ui_thread", "_ui_stop", "_pending_status",
+)
+
+class _SteeringLogicBase:
     """
     Manages mouse input, steering calculations, and vJoy output.
     Communicates with the GUI via callbacks or Qt signals.
     """
-    if HAS_PYQT:
-        # Define signals that can be emitted to the GUI
-        data_updated = pyqtSignal(dict)
-        status_changed = pyqtSignal(str)
-        vjoy_status_changed = pyqtSignal(str)
-        error_occurred = pyqtSignal(str)
+    __slots__ = () # The concrete class from _make_steering_cls declares _STEERING_SLOTS
+    _use_qt = False # Overridden per concrete class
 
     def __init__(self, parent_gui_callback=None):
         super().__init__() # Call QObject.__init__ if applicable
@@ -58,36 +145,72 @@ class SteeringLogic(QObject if config.HAS_PYQT else object): # Inherit QObject i
         self.max_degrees = config.MAX_STEERING_DEGREES
         self.direction_change_threshold = config.DIRECTION_CHANGE_THRESHOLD_DEG
         self.mouse_center_threshold = config.MOUSE_CENTER_THRESHOLD_PX
+        self._mouse_center_threshold_sq = self.mouse_center_threshold ** 2 # Compared against squared offset
+        self._real_time_mode = config.TIME_DELTA_MODE == "real_time"
+        self._update_axis_scale()
 
         # State variables
         self.current_raw_angle = 0.0
         self.previous_smoothed_angle = 0.0
         self.total_accumulated_degrees = 0.0
         self.rotation_direction = "None" # "Clockwise", "Counterclockwise", "None"
-        self.current_offset = 0.0
+        self.current_offset = 0.0 # Materialized from _current_offset_sq only when sent to the GUI
+        self._current_offset_sq = 0.0
         self.angular_velocity = 0.0 # Degrees per event (or per second if using time_delta)
-        self.previous_angular_velocity = 0.0
         self.angular_acceleration = 0.0
 
         # Screen and mouse position (to be set by GUI)
         self.screen_center_x = None
         self.screen_center_y = None
 
-        # Smoothing
-        self.angle_history = deque(maxlen=config.ANGLE_SMOOTHING_FACTOR)
-        self.last_event_time = None # For time-based calculations if TIME_DELTA_MODE is 'real_time'
+        # Smoothing: ring buffers of unit-vector components (cos, sin) with running sums.
+        # Averaging the vectors instead of raw degrees keeps the average continuous across
+        # the +/-180 deg atan2 seam, and the running sums keep it O(1) per event.
+        self._angbuf_size = max(1, config.ANGLE_SMOOTHING_FACTOR)
+        self._cosbuf = [1.0] * self._angbuf_size
+        self._sinbuf = [0.0] * self._angbuf_size
+        self._angidx = 0 # Next slot to overwrite (oldest sample)
+        self._sx = float(self._angbuf_size) # Running sum of cos components
+        self._sy = 0.0 # Running sum of sin components
+        self._samples_since_resync = 0
+        self.last_event_time = None # perf_counter_ns() of the last sample, if TIME_DELTA_MODE is 'real_time'
 
         # vJoy and mouse listener
         self.vjoy_device = None
+        # vJoy position report (pyvjoy's JOYSTICK_POSITION struct) and its bound update(); the axis
+        # is written into the cached struct and pushed with one UpdateVJD call.
+        self._vjoy_pos = None
+        self._vjoy_update = None
+        self._last_axis_value = config.CENTER_VJOY_AXIS # Last value written to vJoy; duplicates are skipped
         self.mouse_listener = None
+        self._mouse_controller = None # pynput Controller for position reads, created on first use
         self.is_steering = False
+
+        # Event coalescing: pynput only stores the newest position (tuple assignment is atomic
+        # under the GIL); a worker thread processes it at STEERING_TICK_RATE_HZ.
+        self._latest_xy = None
+        self._steer_thread = None
+        self._state_lock = threading.Lock() # Guards steering state shared with recenter_view
         self.vjoy_status_message = "vJoy: Not Initialized"
 
+        # GUI dispatcher: the mouse callback only marks state dirty; a timer running at
+        # UI_REFRESH_RATE_MS sends the snapshot, so the listener thread never waits on the GUI.
+        self._dirty = False
+        self._ui_timer = None  # QTimer in the GUI thread (Qt only)
+        self._ui_thread = None # Tick thread without Qt, stopped by setting _ui_stop
+        self._ui_stop = None
+        self._pending_status = None # Coalesced status text awaiting the next UI tick
+        if self._use_qt:
+            from PyQt6.QtCore import QTimer
+            self._ui_timer = QTimer(self)
+            self._ui_timer.setInterval(config.UI_REFRESH_RATE_MS)
+            self._ui_timer.timeout.connect(self._on_ui_tick)
+
         self._initialize_vjoy()
 
     def _emit_or_callback(self, signal_name_or_type, data):
         """Helper to emit Qt signal or use traditional callback."""
-        if HAS_PYQT:
+        if self._use_qt:
             if signal_name_or_type == "data_updated" and hasattr(self, 'data_updated'):
                 self.data_updated.emit(data)
             elif signal_name_or_type == "status_changed" and hasattr(self, 'status_changed'):
@@ -104,20 +227,87 @@ class SteeringLogic(QObject if config.HAS_PYQT else object): # Inherit QObject i
             self.parent_gui_callback(signal_name_or_type, data)
 
 
+    def _update_axis_scale(self):
+        """Precomputes axis = accum * _axis_scale + _axis_offset, mapping [-max_degrees, max_degrees] to the vJoy range."""
+        self._axis_scale = (_VMAX - _VMIN) / (2 * self.max_degrees) if self.max_degrees else 0.0
+        self._axis_offset = _VMIN + (_VMAX - _VMIN) * 0.5
+
+    def _write_axis(self, axis_value: int) -> None:
+        """Writes the vJoy X axis, skipping the driver call when the value is unchanged."""
+        if axis_value != self._last_axis_value and self._vjoy_pos is not None:
+            self._vjoy_pos.wAxisX = axis_value
+            self._vjoy_update()
+            self._last_axis_value = axis_value
+
+    def _start_ui_dispatcher(self):
+        """Starts the periodic GUI update tick (QTimer, or one daemon thread without Qt)."""
+        if self._use_qt:
+            self._ui_timer.start()
+        else:
+            self._ui_stop = threading.Event()
+            self._ui_thread = threading.Thread(target=self._threaded_ui_loop, args=(self._ui_stop,),
+                                               name="MoS-ui-tick", daemon=True)
+            self._ui_thread.start()
+
+    def _stop_ui_dispatcher(self):
+        if self._use_qt:
+            self._ui_timer.stop()
+        elif self._ui_stop:
+            # Not joined: stop() may be called from a GUI callback running on the tick thread itself
+            self._ui_stop.set()
+            self._ui_stop = self._ui_thread = None
+
+    def _threaded_ui_loop(self, stop_event):
+        """Tick thread without Qt: runs _on_ui_tick every UI_REFRESH_RATE_MS until stop_event is set."""
+        interval = config.UI_REFRESH_RATE_MS / 1000.0
+        while not stop_event.wait(interval):
+            self._on_ui_tick()
+
+    def _on_ui_tick(self):
+        """Sends a data update to the GUI if the steering state changed since the last tick."""
+        if self._dirty:
+            self._dirty = False
+            self._send_data_update()
+        if self._pending_status is not None:
+            self._flush_pending_status()
+
+    def _schedule_status_flush(self):
+        """Emits the pending status once after UI_REFRESH_RATE_MS while the UI dispatcher is idle."""
+        if self._use_qt:
+            from PyQt6.QtCore import QTimer
+            QTimer.singleShot(config.UI_REFRESH_RATE_MS, self._flush_pending_status)
+        else:
+            timer = threading.Timer(config.UI_REFRESH_RATE_MS / 1000.0, self._flush_pending_status)
+            timer.daemon = True
+            timer.start()
+
+    def _flush_pending_status(self):
+        status = self._pending_status
+        if status is not None:
+            self._pending_status = None
+            self._emit_or_callback("status_changed", status)
+
     def _initialize_vjoy(self):
         try:
             self.vjoy_device = pyvjoy.VJoyDevice(config.VJOY_DEVICE_ID)
-            self.vjoy_device.set_axis(pyvjoy.HID_USAGE_X, config.CENTER_VJOY_AXIS)
+            self._vjoy_pos = self.vjoy_device.data
+            self._vjoy_update = self.vjoy_device.update
+            for field in _CENTERED_VJOY_AXES:
+                setattr(self._vjoy_pos, field, config.CENTER_VJOY_AXIS)
+            self._vjoy_update()
+            self._last_axis_value = config.CENTER_VJOY_AXIS
             self.vjoy_status_message = "Connected"
-            print(f"vJoy device {config.VJOY_DEVICE_ID} initialized and centered.")
+            log.debug("vJoy device %s initialized and centered.", config.VJOY_DEVICE_ID)
         except pyvjoy.exceptions.vJoyFailedToAcquireException as e:
             self.vjoy_status_message = f"Error acquiring: {e}"
-            print(f"Error acquiring vJoy device {config.VJOY_DEVICE_ID}: {e}")
+            log.error("Error acquiring vJoy device %s: %s", config.VJOY_DEVICE_ID, e)
             self.vjoy_device = None
+            self._vjoy_pos = self._vjoy_update = None
         except Exception as e:
             self.vjoy_status_message = f"Not Found or General Error: {e}"
-            print(f"General vJoy Error for device {config.VJOY_DEVICE_ID}: {e}")
+            log.error("General vJoy Error for device %s: %s", config.VJOY_DEVICE_ID, e)
             self.vjoy_device = None
+            self._vjoy_pos = self._vjoy_update = None
         self._emit_or_callback("vjoy_status_changed", self.vjoy_status_message)
 
 
@@ -126,23 +316,47 @@ class SteeringLogic(QObject if config.HAS_PYQT else object): # Inherit QObject i
         self.screen_center_y = center_y
         # Initialize previous_smoothed_angle based on current mouse position relative to the new center
         # This helps prevent a large initial jump in delta_angle when steering starts.
+        self._prime_angle_state()
+
+    def _prime_angle_state(self):
+        """Seeds previous_smoothed_angle and the smoothing buffers from the current mouse position."""
         try:
-            # pynput's mouse controller can get current position without an active listener
-            controller = pynput_mouse.Controller()
-            current_mouse_x, current_mouse_y = controller.position
-            self.previous_smoothed_angle = self._calculate_raw_angle(current_mouse_x, current_mouse_y)
+            # pynput's mouse controller can get current position without an active listener.
+            # Created once and reused: constructing it binds OS handles.
+            if self._mouse_controller is None:
+                self._mouse_controller = pynput_mouse.Controller()
+            current_mouse_x, current_mouse_y = self._mouse_controller.position
+            _, _, self.previous_smoothed_angle = self._delta_and_angle(current_mouse_x, current_mouse_y)
         except Exception as e:
-            print(f"Warning: Could not get initial mouse position for screen center: {e}. Defaulting angle.")
+            log.warning("Could not get current mouse position: %s. Defaulting angle.", e)
             self.previous_smoothed_angle = 0.0 # Fallback
 
-        self.angle_history.clear()
-        for _ in range(self.angle_history.maxlen or 1): # Ensure maxlen is at least 1
-            self.angle_history.append(self.previous_smoothed_angle)
-
-    def _calculate_raw_angle(self, x, y):
+        self._fill_angle_buffer(self.previous_smoothed_angle)
+
+    def _fill_angle_buffer(self, angle: float) -> None:
+        """Primes every slot of the smoothing ring buffers with the unit vector of the given angle."""
+        rad = math.radians(angle)
+        ux, uy = math.cos(rad), math.sin(rad)
+        self._cosbuf[:] = [ux] * self._angbuf_size
+        self._sinbuf[:] = [uy] * self._angbuf_size
+        self._angidx = 0
+        self._sx = ux * self._angbuf_size
+        self._sy = uy * self._angbuf_size
+        self._samples_since_resync = 0
+
+    def _resync_angle_sums(self) -> None:
+        """Recomputes the running sums exactly from the ring buffers, discarding accumulated rounding error."""
+        self._sx = math.fsum(self._cosbuf)
+        self._sy = math.fsum(self._sinbuf)
+        self._samples_since_resync = 0
+
+    def _delta_and_angle(self, x: float, y: float) -> tuple[float, float, float]:
+        """Returns (dx, dy, angle): the mouse offset from the screen center and its atan2 angle in degrees."""
         if self.screen_center_x is None or self.screen_center_y is None:
-            return 0.0
-        return math.degrees(math.atan2(y - self.screen_center_y, x - self.screen_center_x))
+            return 0.0, 0.0, 0.0
+        dx = x - self.screen_center_x
+        dy = y - self.screen_center_y
+        return dx, dy, math.degrees(math.atan2(dy, dx))
 
     def start(self):
         if self.is_steering:
@@ -159,33 +373,26 @@ class SteeringLogic(QObject if config.HAS_PYQT else object): # Inherit QObject i
 
         self.is_steering = True
         # Reset/Initialize relevant state variables for a fresh start
-        try:
-            controller = pynput_mouse.Controller()
-            current_mouse_x, current_mouse_y = controller.position
-            self.previous_smoothed_angle = self._calculate_raw_angle(current_mouse_x, current_mouse_y)
-        except Exception:
-            self.previous_smoothed_angle = 0.0 # Fallback
-
-        self.angle_history.clear()
-        for _ in range(self.angle_history.maxlen or 1):
-             self.angle_history.append(self.previous_smoothed_angle)
+        self._prime_angle_state()
 
         self.angular_velocity = 0.0
-        self.previous_angular_velocity = 0.0
         self.angular_acceleration = 0.0
         self.rotation_direction = "None"
-        if config.TIME_DELTA_MODE == "real_time":
-            self.last_event_time = time.perf_counter()
-
-        # Start the pynput mouse listener
-        # Listener runs in its own thread, so on_move needs to be thread-safe if it modifies shared state
-        # that is also accessed by the GUI thread directly (which it does via callbacks/signals).
-        # PyQt signals are thread-safe. Direct callbacks to GUI methods that update widgets
-        # must be handled carefully (e.g., using QMetaObject.invokeMethod or QTimer.singleShot(0, ...)).
+        if self._real_time_mode:
+            self.last_event_time = time.perf_counter_ns()
+
+        # Start the steering worker and the pynput mouse listener.
+        # The listener runs in its own thread and only hands positions to the worker thread;
+        # the GUI reads the resulting state through the UI dispatcher (QTimer in the GUI thread),
+        # so neither thread touches widgets directly.
+        self._latest_xy = None
+        self._steer_thread = threading.Thread(target=self._steer_loop, name="MoS-steer", daemon=True)
+        self._steer_thread.start()
         self.mouse_listener = pynput_mouse.Listener(on_move=self._on_move_handler)
         self.mouse_listener.start()
+        self._start_ui_dispatcher()
         self._emit_or_callback("status_changed", "Steering Active")
-        print("Steering started.")
+        log.debug("Steering started.")
 
     def stop(self):
         if not self.is_steering:
@@ -193,125 +400,136 @@ class SteeringLogic(QObject if config.HAS_PYQT else object): # Inherit QObject i
             return
 
         self.is_steering = False
+        self._stop_ui_dispatcher()
+        self._dirty = False
+        self._flush_pending_status() # A status coalesced while steering would otherwise wait for the next change
         if self.mouse_listener:
             self.mouse_listener.stop() # Request listener to stop
             # self.mouse_listener.join() # Wait for listener thread to finish - can cause deadlock if called from listener thread
             self.mouse_listener = None
+        if self._steer_thread:
+            self._steer_thread.join() # Exits within one tick; ensures no late axis write after centering
+            self._steer_thread = None
 
-        if self.vjoy_device:
-            self.vjoy_device.set_axis(pyvjoy.HID_USAGE_X, config.CENTER_VJOY_AXIS)
+        self._write_axis(config.CENTER_VJOY_AXIS)
 
         self.angular_velocity = 0.0
         self.angular_acceleration = 0.0
         self._emit_or_callback("status_changed", "Steering Stopped")
-        print("Steering stopped.")
+        log.debug("Steering stopped.")
         # Send final state
         self._send_data_update()
 
 
-    def _on_move_handler(self, x, y):
-        if not self.is_steering or self.screen_center_x is None:
+    def _on_move_handler(self, x: int, y: int) -> bool:
+        """pynput callback: only records the newest position so the listener thread returns immediately."""
+        if not self.is_steering:
             return False # Returning False from on_move can stop the listener
+        self._latest_xy = (x, y)
+        return True # Keep listener alive
 
-        time_delta = 1.0 # Default if per_event
-        if config.TIME_DELTA_MODE == "real_time":
-            current_time = time.perf_counter()
-            time_delta = current_time - (self.last_event_time if self.last_event_time is not None else current_time)
-            self.last_event_time = current_time
-            if time_delta == 0: time_delta = 1e-6 # Avoid division by zero, use a tiny non-zero value
-
-        self.current_offset = math.sqrt((x - self.screen_center_x)**2 + (y - self.screen_center_y)**2)
-        self.current_raw_angle = self._calculate_raw_angle(x, y)
-        self.angle_history.append(self.current_raw_angle)
-        current_smoothed_angle = sum(self.angle_history) / len(self.angle_history)
-
-        delta_angle = current_smoothed_angle - self.previous_smoothed_angle
-        if delta_angle > 180: delta_angle -= 360
-        elif delta_angle < -180: delta_angle += 360
-
-        # Velocity/Acceleration based on time_delta (can be per-event if time_delta=1)
-        new_angular_velocity = delta_angle / time_delta
-        self.angular_acceleration = (new_angular_velocity - self.angular_velocity) / time_delta
-        self.angular_velocity = new_angular_velocity
-        # previous_angular_velocity is not needed if we define accel as change from last event's velocity
-
-        if self.current_offset < self.mouse_center_threshold:
-            self.rotation_direction = "None"
-        elif delta_angle > self.direction_change_threshold:
-            self.rotation_direction = "Clockwise"
-            self.total_accumulated_degrees += abs(delta_angle) # Use raw delta_angle for accumulation step
-        elif delta_angle < -self.direction_change_threshold:
-            self.rotation_direction = "Counterclockwise"
-            self.total_accumulated_degrees -= abs(delta_angle)
-        else:
-            self.rotation_direction = "None"
+    def _steer_loop(self) -> None:
+        """Worker thread: processes the most recent mouse position at a fixed rate while steering."""
+        interval = 1.0 / config.STEERING_TICK_RATE_HZ
+        last_xy = None
+        while self.is_steering:
+            xy = self._latest_xy
+            if xy is not last_xy: # A new tuple is stored per event, so identity means "no new movement"
+                last_xy = xy
+                with self._state_lock:
+                    self._process_sample(xy[0], xy[1])
+            time.sleep(interval)
+
+    def _process_sample(self, x: int, y: int) -> None:
+        cx = self.screen_center_x
+        if cx is None:
+            return
 
-        self.total_accumulated_degrees = max(-self.max_degrees, min(self.max_degrees, self.total_accumulated_degrees))
+        time_delta = 1.0 # Default if per_event
+        if self._real_time_mode:
+            # Integer nanoseconds: exact subtraction, and `or 1` replaces the zero-delta float check
+            now_ns = time.perf_counter_ns()
+            last_ns = self.last_event_time
+            dt_ns = (now_ns - last_ns if last_ns is not None else 0) or 1
+            self.last_event_time = now_ns
+            time_delta = dt_ns * 1e-9 # Seconds; velocity is then in degrees per second
+
+        # Locals avoid repeated attribute lookups on this per-event path
+        idx = self._angidx
+        cosbuf = self._cosbuf
+        sinbuf = self._sinbuf
+        (ux, uy, self._sx, self._sy, self.current_raw_angle, current_smoothed_angle,
+         self.angular_velocity, self.angular_acceleration, self.total_accumulated_degrees,
+         direction_code, axis_value, self._current_offset_sq) = _step(
+            x - cx, y - self.screen_center_y,
+            cosbuf[idx], sinbuf[idx], cosbuf[idx - 1], sinbuf[idx - 1],
+            self._sx, self._sy, self.previous_smoothed_angle, self.angular_velocity,
+            self.total_accumulated_degrees, time_delta, self.max_degrees,
+            self.direction_change_threshold, self._mouse_center_threshold_sq,
+            self._axis_scale, self._axis_offset, _VMIN, _VMAX)
+        cosbuf[idx] = ux
+        sinbuf[idx] = uy
+        self._angidx = (idx + 1) % self._angbuf_size
+        self._samples_since_resync += 1
+        if self._samples_since_resync >= _SMOOTHING_RESYNC_INTERVAL:
+            self._resync_angle_sums()
+        self.rotation_direction = _ROTATION_DIRECTIONS[direction_code]
         self.previous_smoothed_angle = current_smoothed_angle
 
-        if self.vjoy_device:
-            # Scale total_accumulated_degrees
-            if (2 * self.max_degrees) == 0: normalized_value = 0.5
-            else: normalized_value = (self.total_accumulated_degrees + self.max_degrees) / (2 * self.max_degrees)
-            axis_value = int(normalized_value * (config.MAX_VJOY_AXIS - config.MIN_VJOY_AXIS) + config.MIN_VJOY_AXIS)
-            axis_value = max(config.MIN_VJOY_AXIS, min(config.MAX_VJOY_AXIS, axis_value))
-            self.vjoy_device.set_axis(pyvjoy.HID_USAGE_X, axis_value)
+        # Inlined _write_axis: only cross the driver boundary when the axis actually moved
+        if axis_value != self._last_axis_value:
+            vjoy_pos = self._vjoy_pos
+            if vjoy_pos is not None:
+                vjoy_pos.wAxisX = axis_value
+                self._vjoy_update()
+                self._last_axis_value = axis_value
 
-        self._send_data_update()
-        return True # Keep listener alive
+        self._dirty = True # Picked up by the next UI tick
 
     def _send_data_update(self):
         """Helper to package and send data to GUI."""
-        axis_val = config.CENTER_VJOY_AXIS
-        if self.vjoy_device:
-            # This recalculates, ideally store from _on_move_handler if vJoy was updated there
-            if (2 * self.max_degrees) == 0: norm_val = 0.5
-            else: norm_val = (self.total_accumulated_degrees + self.max_degrees) / (2 * self.max_degrees)
-            axis_val = int(norm_val * (config.MAX_VJOY_AXIS - config.MIN_VJOY_AXIS) + config.MIN_VJOY_AXIS)
-            axis_val = max(config.MIN_VJOY_AXIS, min(config.MAX_VJOY_AXIS, axis_val))
-
-        data = {
-            "offset": self.current_offset,
-            "raw_angle": self.current_raw_angle,
-            "smoothed_angle": self.previous_smoothed_angle, # Or current_smoothed_angle from local context
-            "total_accumulated_degrees": self.total_accumulated_degrees,
-            "rotation_direction": self.rotation_direction,
-            "angular_velocity": self.angular_velocity,
-            "angular_acceleration": self.angular_acceleration,
-            "vjoy_axis_value": axis_val,
-            "is_steering": self.is_steering
-        }
-        self._emit_or_callback("data_updated", data)
+        self._emit_or_callback("data_updated", self.get_current_update())
+
+    def get_current_update(self):
+        """Returns the current steering state as a SteerUpdate (the data_updated payload)."""
+        self.current_offset = math.sqrt(self._current_offset_sq)
+        return SteerUpdate(
+            self.current_offset,
+            self.current_raw_angle,
+            self.previous_smoothed_angle, # Or current_smoothed_angle from local context
+            self.total_accumulated_degrees,
+            self.rotation_direction,
+            self.angular_velocity,
+            self.angular_acceleration,
+            self._last_axis_value,
+            self.is_steering,
+        )
 
     def recenter_view(self):
-        self.total_accumulated_degrees = 0.0
-        self.angular_velocity = 0.0
-        # self.previous_angular_velocity = 0.0 # Keep this to avoid large accel spike if movement continues
-        self.angular_acceleration = 0.0
-
-        try: # Re-initialize previous_smoothed_angle based on current mouse pos
-            controller = pynput_mouse.Controller()
-            current_mouse_x, current_mouse_y = controller.position
-            self.previous_smoothed_angle = self._calculate_raw_angle(current_mouse_x, current_mouse_y)
-        except Exception: self.previous_smoothed_angle = 0.0
+        with self._state_lock: # The steering thread may be mid-sample
+            self.total_accumulated_degrees = 0.0
+            self.angular_velocity = 0.0
+            self.angular_acceleration = 0.0
 
-        self.angle_history.clear()
-        for _ in range(self.angle_history.maxlen or 1):
-            self.angle_history.append(self.previous_smoothed_angle)
+            self._prime_angle_state() # Re-initialize previous_smoothed_angle based on current mouse pos
 
-        if self.vjoy_device:
-            self.vjoy_device.set_axis(pyvjoy.HID_USAGE_X, config.CENTER_VJOY_AXIS)
+            self._write_axis(config.CENTER_VJOY_AXIS)
 
         self._emit_or_callback("status_changed", "View Recentered")
         self._send_data_update() # Send updated state
-        print("Steering view reset.")
+        log.debug("Steering view reset.")
 
     def set_sensitivity(self, new_sensitivity):
         self.sensitivity = float(new_sensitivity)
         # Future: this sensitivity could scale delta_angle before accumulation or affect smoothing.
         # For now, it's a parameter that the GUI can control.
-        self._emit_or_callback("status_changed", f"Sensitivity: {self.sensitivity:.2f}")
-        print(f"Sensitivity updated to: {self.sensitivity:.2f}")
+        # Slider drags call this continuously: the status text is coalesced onto the UI tick
+        # (or one deferred flush when not steering) instead of being emitted per call.
+        flush_scheduled = self._pending_status is not None
+        self._pending_status = f"Sensitivity: {self.sensitivity:.2f}"
+        if not flush_scheduled and not self.is_steering:
+            self._schedule_status_flush()
+        log.debug("Sensitivity updated to: %.2f", self.sensitivity)
 
     def get_current_status_summary(self):
         """Returns a snapshot of key status elements, useful for GUI init or polling."""
@@ -327,31 +545,57 @@ class SteeringLogic(QObject if config.HAS_PYQT else object): # Inherit QObject i
         }
 
     def _get_current_vjoy_axis_value(self):
-        if not self.vjoy_device: return config.CENTER_VJOY_AXIS
-        if (2 * self.max_degrees) == 0: normalized_value = 0.5
-        else: normalized_value = (self.total_accumulated_degrees + self.max_degrees) / (2 * self.max_degrees)
-        axis_value = int(normalized_value * (config.MAX_VJOY_AXIS - config.MIN_VJOY_AXIS) + config.MIN_VJOY_AXIS)
-        return max(config.MIN_VJOY_AXIS, min(config.MAX_VJOY_AXIS, axis_value))
+        """Returns the axis value last written to vJoy (center when no device is available)."""
+        return self._last_axis_value
 
 
     def close(self):
-        print("Closing SteeringLogic...")
+        log.debug("Closing SteeringLogic...")
         self.stop() # Ensure listener is stopped and vJoy centered
         # Any other cleanup (e.g. if using QObject and it needs manual deletion)
-        print("SteeringLogic closed.")
+        log.debug("SteeringLogic closed.")
+
+def _make_steering_cls(use_qt: bool):
+    """
+    Builds the concrete SteeringLogic class: a QObject subclass carrying the GUI signals when
+    use_qt is set, otherwise a plain class that reports through parent_gui_callback.
+    """
+    namespace = {
+        "__module__": __name__,
+        "__doc__": _SteeringLogicBase.__doc__,
+        "__slots__": _STEERING_SLOTS,
+        "_use_qt": use_qt,
+    }
+    if not use_qt:
+        return type("SteeringLogic", (_SteeringLogicBase,), namespace)
+
+    from PyQt6.QtCore import QObject, pyqtSignal
+    # Signals that can be emitted to the GUI
+    namespace.update(
+        data_updated=pyqtSignal(object), # SteerUpdate
+        status_changed=pyqtSignal(str),
+        vjoy_status_changed=pyqtSignal(str),
+        error_occurred=pyqtSignal(str),
+    )
+    # _SteeringLogicBase first so its __init__ runs and chains to QObject.__init__ via super()
+    return type("SteeringLogic", (_SteeringLogicBase, QObject), namespace)
+
+SteeringLogic = _make_steering_cls(config.HAS_PYQT)
+
 
 # Example CLI test for core_logic.py
 if __name__ == "__main__":
+    logging.basicConfig(level=getattr(logging, config.LOG_LEVEL))
     print("Running core_logic.py CLI test...")
 
     # Dummy callback for CLI testing
     def cli_test_callback(event_type, data):
         if event_type == "data_updated":
             print(
-                f"Data: Accum: {data['total_accumulated_degrees']:.1f}°, "
-                f"Dir: {data['rotation_direction']}, "
-                f"Vel: {data['angular_velocity']:.2f}, Acc: {data['angular_acceleration']:.2f}, "
-                f"VJoy: {data['vjoy_axis_value']}"
+                f"Data: Accum: {data.total_accumulated_degrees:.1f}°, "
+                f"Dir: {data.rotation_direction}, "
+                f"Vel: {data.angular_velocity:.2f}, Acc: {data.angular_acceleration:.2f}, "
+                f"VJoy: {data.vjoy_axis_value}"
             )
         elif event_type == "status_changed":
             print(f"Status: {data}")
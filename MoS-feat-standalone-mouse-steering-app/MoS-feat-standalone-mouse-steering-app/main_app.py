@@ -3,34 +3,73 @@ Main application file for the Mouse Steering (MoS) program.
 Contains the PyQt6 GUI.
 """
 import sys
+import logging
 import qdarkstyle # For a dark theme, if available and chosen
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QSlider, QDial, QFrame, QProgressBar, QMessageBox, QCheckBox
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSlot, QSize
-from PyQt6.QtGui import QFont, QPalette, QColor, QPainter, QPen, QBrush
-import math # For trigonometric functions in SteeringWheelWidget
+from PyQt6.QtCore import (
+    Qt, QEvent, QTimer, QPropertyAnimation, QSignalBlocker, pyqtProperty, pyqtSlot,
+    QSize, QLineF, QPointF, QRect, QRectF
+)
+from PyQt6.QtGui import QFont, QPalette, QColor, QPainter, QPen, QBrush, QPixmap
+from math import cos, sin, radians # Trigonometry for SteeringWheelWidget, bound as bare globals
+from operator import attrgetter
 
 import config
-from core_logic import SteeringLogic
+from core_logic import SteeringLogic, SteerUpdate
+
+def _make_tick_lines(num_visual_ticks=12):
+    """
+    Precomputes the reference tick segments (in the widget's 200x200 drawing space) as
+    (major_ticks, minor_ticks) lists of QLineF: each tick runs from the inner rim outwards,
+    like a clock face. Each list is drawn with one drawLines call.
+    """
+    major_ticks, minor_ticks = [], []
+    for i in range(num_visual_ticks):
+        angle_rad_tick = radians(i * (360.0 / num_visual_ticks))
+        is_major_tick = (i % 3 == 0) # Make every 3rd tick slightly longer/thicker
+        tick_length = 10 if is_major_tick else 6
+        # Same as rotating the vertical segment (0, -80) -> (0, -80 - tick_length) by the tick angle
+        sin_a, cos_a = sin(angle_rad_tick), cos(angle_rad_tick)
+        inner, outer = 80, 80 + tick_length
+        tick_line = QLineF(inner * sin_a, -inner * cos_a, outer * sin_a, -outer * cos_a)
+        (major_ticks if is_major_tick else minor_ticks).append(tick_line)
+    return major_ticks, minor_ticks
+
+_MAJOR_TICK_LINES, _MINOR_TICK_LINES = _make_tick_lines()
 
 class SteeringWheelWidget(QWidget):
     """
     A custom PyQt6 widget to visually represent the steering wheel's angle.
     Displays a dial with an indicator line that rotates based on the input angle.
     """
+    _ORIGIN = QPointF(0.0, 0.0) # Wheel center in the 200x200 drawing space
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.angle = 0  # Current steering angle in degrees
+        self._angle = 0.0  # Current steering angle in degrees (the animatable "angle" property)
         self.max_degrees = config.MAX_STEERING_DEGREES # Max possible steering angle
         self.setMinimumSize(150, 150) # Ensure the widget has a reasonable default size
+        # Every paint covers the whole dirty rect with the opaque cached layer, so Qt doesn't
+        # need to repaint the parent behind the wheel first
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
 
         # Default colors, can be updated by theme changes
         self.wheel_color = QColor(Qt.GlobalColor.cyan)
         self.indicator_color = QColor(Qt.GlobalColor.red)
         self.tick_color = QColor(Qt.GlobalColor.lightGray)
         self.background_color = QColor(Qt.GlobalColor.transparent) # Or a specific background
+        self._build_pens()
+
+        # Rim, hub and ticks never move: they are rendered once into a pixmap and blitted
+        # each paint; rebuilt when the size or colors change.
+        self._static_pixmap = None
+        self._static_size = None
+        self._display_angle = 0.0 # Indicator rotation, derived from angle in set_angle
+        self._indicator_rect = QRect() # Area covered by the indicator at the current angle
 
     def set_angle(self, angle_degrees: float):
         """
@@ -38,8 +77,33 @@ class SteeringWheelWidget(QWidget):
         The angle is clamped to the [-max_degrees, +max_degrees] range.
         Triggers a repaint of the widget.
         """
-        self.angle = max(-self.max_degrees, min(self.max_degrees, angle_degrees))
-        self.update() # Request a repaint
+        self._angle = max(-self.max_degrees, min(self.max_degrees, angle_degrees))
+        # Indicator rotation within the current turn; float % already maps negatives into [0, 360)
+        self._display_angle = self._angle % 360.0
+        # Only the indicator moves: repaint the area it leaves plus the area it now covers
+        new_rect = self._compute_indicator_rect(self._display_angle)
+        self.update(new_rect.united(self._indicator_rect)) # Request a repaint
+        self._indicator_rect = new_rect
+
+    def get_angle(self) -> float:
+        return self._angle
+
+    # Qt property so QPropertyAnimation can drive the wheel (see MainWindow._flush_gui_data)
+    angle = pyqtProperty(float, fget=get_angle, fset=set_angle)
+
+    def _compute_indicator_rect(self, angle_degrees):
+        """Returns the widget-space bounding rect of the indicator line drawn at the given angle."""
+        side = min(self.width(), self.height())
+        scale = side / 200.0
+        rad = radians(angle_degrees)
+        sin_a, cos_a = sin(rad), cos(rad)
+        cx, cy = self.width() / 2, self.height() / 2
+        # Indicator runs from (0, 10) to (0, -75) in the 200x200 drawing space, rotated clockwise
+        x1, y1 = cx - 10 * sin_a * scale, cy + 10 * cos_a * scale
+        x2, y2 = cx + 75 * sin_a * scale, cy - 75 * cos_a * scale
+        pad = 3 * scale + 2 # Half the round-capped pen width, plus antialiasing slack
+        return QRectF(min(x1, x2) - pad, min(y1, y2) - pad,
+                      abs(x2 - x1) + 2 * pad, abs(y2 - y1) + 2 * pad).toAlignedRect()
 
     def set_colors(self, wheel_color, indicator_color, tick_color, background_color=None):
         """Allows external theme changes to update widget colors."""
@@ -48,17 +112,40 @@ class SteeringWheelWidget(QWidget):
         self.tick_color = tick_color
         if background_color:
             self.background_color = background_color
+        self._build_pens()
+        self._static_pixmap = None # Colors are baked into the cached layer
         self.update()
 
-    def paintEvent(self, event):
-        """Handles the painting of the widget."""
-        painter = QPainter(self)
+    def _build_pens(self):
+        """Creates the pens and brush for the current colors, so painting doesn't construct them each time."""
+        self._rim_pen = QPen(self.wheel_color, 8, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
+        self._hub_brush = QBrush(self.wheel_color)
+        self._tick_pen_major = QPen(self.tick_color, 3, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
+        self._tick_pen_minor = QPen(self.tick_color, 2, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
+        self._indicator_pen = QPen(self.indicator_color, 6, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
+
+    def resizeEvent(self, event):
+        self._static_pixmap = None
+        self._indicator_rect = self._compute_indicator_rect(self._display_angle)
+        super().resizeEvent(event)
+
+    def _build_static_pixmap(self):
+        """Renders the background, rim, hub and reference ticks into a pixmap the size of the widget."""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing) # Smooth lines
 
         side = min(self.width(), self.height()) # Use the smaller dimension for a circular widget
 
-        # Set background if specified
-        if self.background_color != QColor(Qt.GlobalColor.transparent):
+        # Opaque background: the theme color if specified, else the palette's window color
+        if self.background_color.alpha() == 255:
+            painter.fillRect(self.rect(), self.background_color)
+        else:
+            painter.fillRect(self.rect(), self.palette().color(QPalette.ColorRole.Window))
             painter.fillRect(self.rect(), self.background_color)
 
         # Center the coordinate system and scale for consistent drawing
@@ -67,30 +154,44 @@ class SteeringWheelWidget(QWidget):
 
         # --- Draw the steering wheel ---
         # Outer circle (rim of the wheel)
-        painter.setPen(QPen(self.wheel_color, 8, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
-        painter.drawEllipse(-90, -90, 180, 180) # Diameter 180
+        painter.setPen(self._rim_pen)
+        painter.drawEllipse(self._ORIGIN, 90.0, 90.0) # Diameter 180
 
         # Center hub of the wheel
-        painter.setBrush(QBrush(self.wheel_color))
+        painter.setBrush(self._hub_brush)
         painter.setPen(Qt.PenStyle.NoPen) # No outline for the hub
-        painter.drawEllipse(-10, -10, 20, 20) # Diameter 20
+        painter.drawEllipse(self._ORIGIN, 10.0, 10.0) # Diameter 20
 
         # --- Draw reference ticks on the wheel ---
-        # This section draws static ticks on the wheel rim.
-        # The indicator will rotate relative to these.
-        num_visual_ticks = 12 # e.g., like a clock face
-        for i in range(num_visual_ticks):
-            angle_deg_tick = i * (360.0 / num_visual_ticks)
-            painter.save() # Save current painter state
-            painter.rotate(angle_deg_tick)
-
-            is_major_tick = (i % 3 == 0) # Make every 3rd tick slightly longer/thicker
-            tick_length = 10 if is_major_tick else 6
-            tick_width = 3 if is_major_tick else 2
-
-            painter.setPen(QPen(self.tick_color, tick_width, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
-            painter.drawLine(0, -80, 0, -80 - tick_length) # Draw tick line from inner rim outwards
-            painter.restore() # Restore painter state
+        # Static ticks on the wheel rim; the indicator rotates relative to these.
+        painter.setPen(self._tick_pen_major)
+        painter.drawLines(_MAJOR_TICK_LINES)
+        painter.setPen(self._tick_pen_minor)
+        painter.drawLines(_MINOR_TICK_LINES)
+        painter.end()
+
+        self._static_pixmap = pixmap
+        self._static_size = self.size()
+
+
+    def paintEvent(self, event):
+        """Handles the painting of the widget."""
+        if self._static_pixmap is None or self._static_size != self.size():
+            self._build_static_pixmap()
+
+        painter = QPainter(self)
+        # Background, rim, hub and ticks: blit only the invalidated part (the whole widget on
+        # resize/theme changes, just the indicator sweep on angle updates)
+        dirty = event.rect()
+        dpr = self._static_pixmap.devicePixelRatio()
+        painter.drawPixmap(dirty, self._static_pixmap,
+                           QRectF(dirty.x() * dpr, dirty.y() * dpr, dirty.width() * dpr, dirty.height() * dpr).toRect())
+
+        side = min(self.width(), self.height()) # Use the smaller dimension for a circular widget
+
+        # Center the coordinate system and scale for consistent drawing
+        painter.translate(self.width() / 2, self.height() / 2)
+        painter.scale(side / 200.0, side / 200.0) # Scale to a base 200x200 drawing area
 
         # --- Draw the rotating indicator line ---
         # The indicator shows the current steering angle.
@@ -100,16 +201,21 @@ class SteeringWheelWidget(QWidget):
         # Option 3: Use the progress bar for total accumulated, and this dial for fine-tuning/current turn.
         # Let's go with Option 1 for a clearer single-turn visual on the dial.
 
-        display_angle = self.angle % 360
-        if self.angle < 0 and display_angle != 0: # Ensure negative angles also map correctly in 0-360 range for rotation
-            display_angle = 360 - abs(display_angle) if abs(display_angle)>1e-3 else 0
+        painter.rotate(self._display_angle) # Rotate based on the current turn's angle
 
-        painter.rotate(display_angle) # Rotate based on the current turn's angle
-
-        painter.setPen(QPen(self.indicator_color, 6, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
+        # The blit above is pixel-aligned and the static layer was antialiased when baked,
+        # so AA is only paid for the indicator line.
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing) # Smooth lines
+        painter.setPen(self._indicator_pen)
         painter.drawLine(0, 10, 0, -75) # Line from near center hub outwards
 
 
+# Status bar label colors keyed by their "state" property ("" keeps the theme's default color)
+_STATUS_LABEL_QSS = """
+QLabel#StatusBarLabel[state="ok"] { color: #A9DC76; }
+QLabel#StatusBarLabel[state="err"] { color: #FF6B68; }
+"""
+
 class MainWindow(QMainWindow):
     """
     Main application window for the Mouse Steering program.
@@ -124,6 +230,23 @@ class MainWindow(QMainWindow):
         # Instantiate the core steering logic
         self.logic = SteeringLogic()
 
+        # Data updates are coalesced: a snapshot arriving while idle is applied at once, later ones
+        # within UI_REFRESH_RATE_MS only keep the newest, which is applied when the interval ends
+        self._pending_data = None
+        self._gui_paused = False # True while minimized/hidden: data is kept but not displayed
+        self._gui_timer = QTimer(self)
+        self._gui_timer.setSingleShot(True)
+        self._gui_timer.setInterval(config.UI_REFRESH_RATE_MS)
+        self._gui_timer.timeout.connect(self._show_pending_data)
+
+        # Sensitivity slider drags are throttled: the newest value is applied once per interval
+        # and immediately on release
+        self._sens_pending = None
+        self._sens_timer = QTimer(self)
+        self._sens_timer.setSingleShot(True)
+        self._sens_timer.setInterval(config.SENSITIVITY_APPLY_INTERVAL_MS)
+        self._sens_timer.timeout.connect(self._apply_pending_sensitivity)
+
         self.setup_ui()      # Create and arrange all widgets
         self.connect_signals_slots() # Connect GUI events and logic signals
         self.apply_theme(config.DEFAULT_THEME) # Apply the initial visual theme
@@ -131,7 +254,7 @@ class MainWindow(QMainWindow):
         # Initialize UI displays with current state from logic
         initial_status = self.logic.get_current_status_summary()
         self.update_vjoy_status_display(initial_status.get("vjoy_status_message", "Initializing..."))
-        self.update_gui_data(initial_status)
+        self.update_gui_data(self.logic.get_current_update())
         self.sensitivity_slider.setValue(int(initial_status.get("sensitivity", config.DEFAULT_SENSITIVITY) * 10))
 
 
@@ -174,6 +297,7 @@ class MainWindow(QMainWindow):
             row_layout.addWidget(lbl_value)
             data_grid_layout.addLayout(row_layout)
             self.labels[key] = lbl_value
+            setattr(self, f"lbl_{key}", lbl_value) # Direct attribute, e.g. self.lbl_offset
 
         add_data_label("Accumulated Angle", "total_accumulated_degrees")
         add_data_label("Direction", "rotation_direction")
@@ -218,6 +342,8 @@ class MainWindow(QMainWindow):
         self.app_status_label.setObjectName("StatusBarLabel")
         self.status_bar.addPermanentWidget(self.vjoy_status_label, stretch=1) # Stretch factor for relative sizing
         self.status_bar.addPermanentWidget(self.app_status_label, stretch=2)
+        # Status colors are selected by a "state" property, so changing state only re-polishes the label
+        self.status_bar.setStyleSheet(_STATUS_LABEL_QSS)
 
         # Theme toggle button (could be in a menu too)
         self.theme_button = QPushButton("Toggle Theme")
@@ -228,12 +354,35 @@ class MainWindow(QMainWindow):
         theme_button_layout.addWidget(self.theme_button)
         main_layout.addLayout(theme_button_layout)
 
+        # Bound getters, formatters and setters for the per-update path: (SteerUpdate field, get, format, setText)
+        label_formats = {
+            "total_accumulated_degrees": "{:.1f}°".format,
+            "rotation_direction": str,
+            "angular_velocity": "{:.2f} °/evt".format,
+            "angular_acceleration": "{:.2f} °/evt²".format,
+            "offset": "{:.1f} px".format,
+            "vjoy_axis_value": str,
+        }
+        self._label_updaters = tuple(
+            (key, attrgetter(key), fmt, getattr(self, f"lbl_{key}").setText)
+            for key, fmt in label_formats.items()
+        )
+        self._set_angle = self.steering_wheel_widget.set_angle
+        # Sub-degree wheel moves are eased over one refresh interval by a single reused animation
+        self._angle_anim = QPropertyAnimation(self.steering_wheel_widget, b"angle", self)
+        self._angle_anim.setDuration(config.UI_REFRESH_RATE_MS)
+        self._set_progress = self.angle_progress_bar.setValue
+        # Last value pushed to each widget; unchanged values skip the Qt call (and its relayout/repaint)
+        self._last_values = {}
+        self._last_is_steering = None
+
 
     def connect_signals_slots(self):
         """Connects GUI widget signals to appropriate slots (methods) and logic signals to GUI slots."""
         self.start_stop_button.clicked.connect(self.on_toggle_steering)
         self.recenter_button.clicked.connect(self.logic.recenter_view) # Directly call logic method
         self.sensitivity_slider.valueChanged.connect(self.on_sensitivity_changed)
+        self.sensitivity_slider.sliderReleased.connect(self._apply_pending_sensitivity)
         self.theme_button.clicked.connect(self.toggle_theme)
 
         # Connect signals from SteeringLogic to GUI slots
@@ -251,53 +400,119 @@ class MainWindow(QMainWindow):
             print("Warning: SteeringLogic not using PyQt signals. Falling back to direct callback if defined.")
             self.logic.parent_gui_callback = self.handle_legacy_callback_from_logic
 
-    @pyqtSlot(dict) # Explicitly mark as a PyQt slot
-    def update_gui_data(self, data: dict):
-        """Updates data display labels and visualizers with new data from SteeringLogic."""
-        self.labels["total_accumulated_degrees"].setText(f"{data.get('total_accumulated_degrees', 0.0):.1f}°")
-        self.labels["rotation_direction"].setText(str(data.get('rotation_direction', 'None')))
-        self.labels["angular_velocity"].setText(f"{data.get('angular_velocity', 0.0):.2f} °/evt")
-        self.labels["angular_acceleration"].setText(f"{data.get('angular_acceleration', 0.0):.2f} °/evt²")
-        self.labels["offset"].setText(f"{data.get('offset', 0.0):.1f} px")
-        self.labels["vjoy_axis_value"].setText(str(data.get('vjoy_axis_value', config.CENTER_VJOY_AXIS)))
-
-        self.steering_wheel_widget.set_angle(data.get('total_accumulated_degrees', 0.0))
-
-        progress_val = data.get('total_accumulated_degrees', 0.0) + config.MAX_STEERING_DEGREES
-        self.angle_progress_bar.setValue(int(progress_val))
+    @pyqtSlot(object) # Explicitly mark as a PyQt slot
+    def update_gui_data(self, data: SteerUpdate):
+        """Shows new data from SteeringLogic right away, or at the end of the current refresh interval."""
+        self._pending_data = data
+        if not self._gui_paused and not self._gui_timer.isActive():
+            self._show_pending_data()
+
+    def _show_pending_data(self):
+        """Applies the queued data, if any, and starts a refresh interval during which new data waits."""
+        if self._pending_data is not None and not self._gui_paused:
+            self._flush_gui_data()
+            self._gui_timer.start()
+
+    def _set_gui_paused(self, paused: bool):
+        """Suspends display refreshes while the window can't be seen; the latest data is shown on resume."""
+        if paused == self._gui_paused:
+            return
+        self._gui_paused = paused
+        if paused:
+            self._gui_timer.stop()
+        else:
+            self._show_pending_data()
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.WindowStateChange:
+            self._set_gui_paused(bool(self.windowState() & Qt.WindowState.WindowMinimized))
+        super().changeEvent(event)
+
+    def hideEvent(self, event):
+        self._set_gui_paused(True)
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        self._set_gui_paused(bool(self.windowState() & Qt.WindowState.WindowMinimized))
+        super().showEvent(event)
+
+    def _flush_gui_data(self):
+        """Updates data display labels and visualizers with the latest queued data."""
+        data = self._pending_data
+        if data is None:
+            return
+        self._pending_data = None
+        last_values = self._last_values
+        for key, get, fmt, set_text in self._label_updaters:
+            text = fmt(get(data))
+            if last_values.get(key) != text:
+                set_text(text)
+                last_values[key] = text
+
+        total_degrees = data.total_accumulated_degrees
+        if last_values.get("angle") != total_degrees:
+            anim = self._angle_anim
+            anim.stop()
+            current_angle = self.steering_wheel_widget.get_angle()
+            if abs(total_degrees - current_angle) < 1.0:
+                anim.setStartValue(current_angle)
+                anim.setEndValue(float(total_degrees))
+                anim.start()
+            else: # Larger jumps are shown immediately
+                self._set_angle(total_degrees)
+            last_values["angle"] = total_degrees
+
+        progress_val = int(total_degrees + config.MAX_STEERING_DEGREES)
+        if last_values.get("progress") != progress_val:
+            self._set_progress(progress_val)
+            last_values["progress"] = progress_val
 
         # Update Start/Stop button state and text
-        is_steering = data.get('is_steering', False)
-        if is_steering != self.start_stop_button.isChecked(): # Sync if different
-            self.start_stop_button.setChecked(is_steering)
-        self.start_stop_button.setText("Stop Steering" if is_steering else "Start Steering")
+        is_steering = data.is_steering
+        if is_steering != self.start_stop_button.isChecked(): # Sync if different (e.g. a failed start)
+            # Programmatic sync only: keep toggled/clicked listeners from re-entering start/stop
+            with QSignalBlocker(self.start_stop_button):
+                self.start_stop_button.setChecked(is_steering)
+        if is_steering != self._last_is_steering:
+            self.start_stop_button.setText("Stop Steering" if is_steering else "Start Steering")
+            self._last_is_steering = is_steering
 
     @pyqtSlot(str)
     def update_app_status_display(self, status_text: str):
         """Updates the application status label in the status bar."""
         self.app_status_label.setText(f"App: {status_text}")
-        # Basic color coding for status (can be enhanced with QSS)
+        # Basic color coding for status (see _STATUS_LABEL_QSS)
         if "Active" in status_text:
-            self.app_status_label.setStyleSheet("color: #A9DC76;") # Greenish
+            self._set_status_state(self.app_status_label, "ok") # Greenish
         elif "Error" in status_text:
-            self.app_status_label.setStyleSheet("color: #FF6B68;") # Reddish
+            self._set_status_state(self.app_status_label, "err") # Reddish
         else: # Default color from stylesheet or palette
-            self.app_status_label.setStyleSheet("")
+            self._set_status_state(self.app_status_label, "")
 
     @pyqtSlot(str)
     def update_vjoy_status_display(self, status_text: str):
         """Updates the vJoy status label in the status bar and enables/disables start button."""
         self.vjoy_status_label.setText(f"vJoy: {status_text}")
         if "Connected" in status_text:
-            self.vjoy_status_label.setStyleSheet("color: #A9DC76;") # Greenish
+            self._set_status_state(self.vjoy_status_label, "ok") # Greenish
             self.start_stop_button.setEnabled(True)
         elif "Error" in status_text or "Not Found" in status_text:
-            self.vjoy_status_label.setStyleSheet("color: #FF6B68;") # Reddish
+            self._set_status_state(self.vjoy_status_label, "err") # Reddish
             self.start_stop_button.setEnabled(False)
         else: # Initializing or other states
-            self.vjoy_status_label.setStyleSheet("")
+            self._set_status_state(self.vjoy_status_label, "")
             self.start_stop_button.setEnabled(False) # Default to disabled if status is unclear
 
+    @staticmethod
+    def _set_status_state(label: QLabel, state: str):
+        """Switches a status label's color state, re-polishing only when the state actually changes."""
+        if label.property("state") == state:
+            return
+        label.setProperty("state", state)
+        style = label.style()
+        style.unpolish(label)
+        style.polish(label)
+
     @pyqtSlot(str)
     def show_error_message(self, error_text: str):
         """Displays a critical error message in a dialog box."""
@@ -341,9 +556,17 @@ class MainWindow(QMainWindow):
         # The button text and actual state will be updated via the data_updated signal.
 
     def on_sensitivity_changed(self, value: int):
-        """Handles changes from the sensitivity slider."""
-        actual_sensitivity = value / 10.0 # Scale slider value (1-100) to sensitivity range (0.1-10.0)
-        self.logic.set_sensitivity(actual_sensitivity)
+        """Handles changes from the sensitivity slider; the value reaches the logic via _apply_pending_sensitivity."""
+        self._sens_pending = value / 10.0 # Scale slider value (1-100) to sensitivity range (0.1-10.0)
+        if not self._sens_timer.isActive():
+            self._sens_timer.start()
+
+    def _apply_pending_sensitivity(self):
+        """Passes the latest slider value to the logic, if one is waiting."""
+        self._sens_timer.stop()
+        if self._sens_pending is not None:
+            actual_sensitivity, self._sens_pending = self._sens_pending, None
+            self.logic.set_sensitivity(actual_sensitivity)
 
     def toggle_theme(self):
         """Switches between dark and light themes."""
@@ -356,6 +579,15 @@ class MainWindow(QMainWindow):
 
     def apply_theme(self, theme_name: str):
         """Applies the specified visual theme to the application."""
+        # Restyling touches nearly every widget; hold their repaints and redraw the window once
+        self.setUpdatesEnabled(False)
+        try:
+            self._apply_theme_styles(theme_name)
+        finally:
+            self.setUpdatesEnabled(True) # Re-enabling schedules a single update of the whole window
+
+    def _apply_theme_styles(self, theme_name: str):
+        """Sets the stylesheet/palette and custom widget colors for the given theme."""
         qss = ""
         palette = QPalette() # Start with a default palette
 
@@ -400,9 +632,12 @@ class MainWindow(QMainWindow):
                     tick_color=QColor(Qt.GlobalColor.darkGray), background_color=QApplication.style().standardPalette().color(QPalette.ColorRole.Window)
                 )
 
-        # Force style updates on some widgets if QSS/Palette changes don't propagate automatically enough
-        self.update_app_status_display(self.app_status_label.text().replace("App: ", ""))
-        self.update_vjoy_status_display(self.vjoy_status_label.text().replace("vJoy: ", ""))
+        # Force style updates on the status labels if QSS/Palette changes don't propagate automatically
+        # enough; re-polishing keeps their text and status colors as they are
+        for status_label in (self.app_status_label, self.vjoy_status_label):
+            style = status_label.style()
+            style.unpolish(status_label)
+            style.polish(status_label)
 
 
     def closeEvent(self, event):
@@ -412,6 +647,7 @@ class MainWindow(QMainWindow):
         event.accept() # Accept the close event
 
 if __name__ == "__main__":
+    logging.basicConfig(level=getattr(logging, config.LOG_LEVEL))
     app = QApplication(sys.argv)
     # It's good practice to set application name and version if distributing
     app.setApplicationName(config.APP_NAME)
@@ -4,7 +4,6 @@ from tkinter import ttk
 from tkinter import font
 from pynput import mouse as pynput_mouse
 import ctypes
-import time
 
 class MouseSteeringApp:
     def __init__(self, root):
@@ -138,8 +137,11 @@ class MouseSteeringApp:
         if not self.is_steering and self.vjoy_device:
             self.is_steering = True
             self.center_mouse()
-            time.sleep(0.1)
+            # Let the cursor settle without blocking the Tk mainloop
+            self.root.after(100, self._start_listener)
 
+    def _start_listener(self):
+        if self.is_steering:  # Stop may have been pressed during the delay
             # Create a new mouse listener every time we start steering
             self.mouse_listener = pynput_mouse.Listener(on_move=self.on_move)
             self.mouse_listener.start()
@@ -1,29 +1,74 @@
-import pyvjoy
 import tkinter as tk
 from tkinter import ttk
 from tkinter import font
-from pynput import mouse as pynput_mouse
 import ctypes
-import time
+import threading
+import functools
+from _steering_kernel import compute as _steer_compute
+
+def _throttle(interval_ms):
+    """Coalesce a Tk callback: run it at most once per interval_ms, always with the latest arguments."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args):
+            pending = self._throttled.get(func)
+            if pending is not None:
+                pending[0] = args  # Already scheduled; the trailing call picks this up
+                return
+            pending = self._throttled[func] = [args]
+
+            def fire():
+                del self._throttled[func]
+                func(self, *pending[0])
+
+            self.root.after(interval_ms, fire)
+        return wrapper
+    return decorator
+
+class POINT(ctypes.Structure):
+    _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
 
 class MouseSteeringApp:
+    # (bg, fg) for the left, center and right indicators, keyed by steering state
+    _IND_STATES = {
+        -1: (("#E74C3C", "white"), ("#ECF0F1", "#27AE60"), ("#ECF0F1", "#3498DB")),
+        0: (("#ECF0F1", "#E74C3C"), ("#27AE60", "white"), ("#ECF0F1", "#3498DB")),
+        1: (("#ECF0F1", "#E74C3C"), ("#ECF0F1", "#27AE60"), ("#3498DB", "white")),
+    }
+
     def __init__(self, root):
         self.root = root
         self.root.title("MoS V1.0")
         self.root.geometry("500x500")
         self.root.configure(bg="#2C3E50")  # Set initial background color
 
-        # vJoy device
+        # vJoy device and the pynput mouse module are loaded on the first Start (see _ensure_vjoy),
+        # so the window and Settings tab come up without the vJoy DLL
         self.vjoy_device = None
-        try:
-            self.vjoy_device = pyvjoy.VJoyDevice(1)
-        except pyvjoy.exceptions.vJoyFailedToAcquireException as e:
-            print(f"Error acquiring vJoy device: {e}")
+        self._pynput_mouse = None
 
         self.sensitivity = 1.0
         self.is_steering = False
+        self._throttled = {}  # Pending _throttle calls: function -> [latest args]
+
+        # Latest (turn_angle, offset_percentage, direction) from the listener thread,
+        # drawn by a single after_idle callback on the Tk thread
+        self._pending_state = None
+        self._ui_scheduled = False
+        self._last_axis = -1  # Last value written to vJoy; repeats are skipped
+        self._ind_state = None  # Key into _IND_STATES currently shown
+        self._last_angle_str = ""  # Label texts last pushed to the StringVars
+        self._last_offset_str = ""
+
+        # vJoy writes run on their own thread so a slow driver call never stalls the mouse hook.
+        # The mailbox holds only the newest axis value; older ones are simply overwritten.
+        self._axis_mbox = [None]
+        self._axis_event = threading.Event()
+        self._writer_alive = True
+        self._writer_thread = None
 
         self.update_center_position()  # Initialize center position
+        _steer_compute(0.0, self._sens_over_half, self._pct_scale)  # Compile (or load cache) before steering starts
         self.create_widgets()
         self.center_mouse()  # Center mouse cursor at start
 
@@ -32,6 +77,9 @@ class MouseSteeringApp:
         # Bind window close event to cleanup
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
+        # Re-read the screen size when the window is moved/resized (resolution or monitor change)
+        self.root.bind("<Configure>", self._on_root_configure)
+
     def create_widgets(self):
         # Create a notebook for tabs
         self.notebook = ttk.Notebook(self.root)
@@ -95,11 +143,13 @@ class MouseSteeringApp:
         self.right_indicator.grid(row=0, column=2, padx=10)
 
         # Angle Label
-        self.angle_label = tk.Label(tab, text="Turn Angle: 0%", font=label_font, bg="#2C3E50", fg="white")
+        self.angle_var = tk.StringVar(value="Turn Angle: 0%")
+        self.angle_label = tk.Label(tab, textvariable=self.angle_var, font=label_font, bg="#2C3E50", fg="white")
         self.angle_label.pack(pady=5)
 
         # Offset Label
-        self.offset_label = tk.Label(tab, text="Offset: 0%", font=label_font, bg="#2C3E50", fg="white")
+        self.offset_var = tk.StringVar(value="Offset: 0%")
+        self.offset_label = tk.Label(tab, textvariable=self.offset_var, font=label_font, bg="#2C3E50", fg="white")
         self.offset_label.pack(pady=5)
 
     def create_settings_controls(self, tab):
@@ -127,17 +177,72 @@ class MouseSteeringApp:
     def update_center_position(self):
         user32 = ctypes.windll.user32
         user32.SetProcessDPIAware()
-        self.screen_width = user32.GetSystemMetrics(0)
-        self.screen_height = user32.GetSystemMetrics(1)
-        self.center_x = self.screen_width // 2
-        self.center_y = self.screen_height // 2
+        # Resolve the cursor calls once with explicit signatures for cheaper marshalling
+        user32.SetCursorPos.argtypes = [ctypes.c_int, ctypes.c_int]
+        user32.SetCursorPos.restype = ctypes.c_bool
+        user32.GetCursorPos.argtypes = [ctypes.POINTER(POINT)]
+        user32.GetCursorPos.restype = ctypes.c_bool
+        self._set_cursor_pos = user32.SetCursorPos
+        self._get_cursor_pos = user32.GetCursorPos
+        self._cursor_pt = POINT()
+        self._get_system_metrics = user32.GetSystemMetrics
+        self._apply_screen_size(user32.GetSystemMetrics(0), user32.GetSystemMetrics(1))
+
+    def _apply_screen_size(self, screen_width, screen_height):
+        # on_move reads these from the listener thread: compute everything first, then assign
+        half_w = screen_width // 2
+        inv_half_w = 1.0 / half_w
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.center_x = half_w
+        self.center_y = screen_height // 2
+        # Per-event scale factors, so on_move only multiplies
+        self._half_w = half_w
+        self._inv_half_w = inv_half_w
+        self._pct_scale = 100.0 * inv_half_w
+        self._sens_over_half = self.sensitivity * inv_half_w
+
+    def _on_root_configure(self, event):
+        if event.widget is not self.root:
+            return  # <Configure> on the root also fires for every child widget
+        width = self._get_system_metrics(0)
+        height = self._get_system_metrics(1)
+        if width != self.screen_width or height != self.screen_height:
+            self._apply_screen_size(width, height)
+
+    def _ensure_vjoy(self):
+        if self.vjoy_device is None:
+            try:
+                import pyvjoy
+            except ImportError as e:
+                print(f"pyvjoy is not available: {e}")
+                return None
+            try:
+                self.vjoy_device = pyvjoy.VJoyDevice(1)
+            except pyvjoy.exceptions.vJoyFailedToAcquireException as e:
+                print(f"Error acquiring vJoy device: {e}")
+                return None
+            # Bound once; on_move writes the axis on every mouse event
+            self._hid_x = pyvjoy.HID_USAGE_X
+            self._set_axis = self.vjoy_device.set_axis
+            self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer_thread.start()
+        return self.vjoy_device
 
     def start_steering(self):
-        if not self.is_steering and self.vjoy_device:
+        if not self.is_steering and self._ensure_vjoy():
+            if self._pynput_mouse is None:
+                from pynput import mouse as pynput_mouse
+                self._pynput_mouse = pynput_mouse
             self.is_steering = True
+            self._last_axis = -1
             self.center_mouse()
-            time.sleep(0.1)
-            self.mouse_listener = pynput_mouse.Listener(on_move=self.on_move)
+            # Let the cursor settle without blocking the Tk mainloop
+            self.root.after(100, self._start_listener)
+
+    def _start_listener(self):
+        if self.is_steering:  # Stop may have been pressed during the delay
+            self.mouse_listener = self._pynput_mouse.Listener(on_move=self.on_move)
             self.mouse_listener.start()
 
     def stop_steering(self):
@@ -148,43 +253,70 @@ class MouseSteeringApp:
 
     def on_move(self, x, y):
         if self.is_steering and self.vjoy_device:
-            delta_x = x - self.center_x
-            turn_angle = (delta_x / (self.screen_width // 2)) * self.sensitivity
-            turn_angle = max(min(turn_angle, 1), -1)  # Clamping to range [-1, 1]
-            axis_value = int((turn_angle + 1) * 16383)  # Map [-1, 1] to [0, 32767]
-            self.vjoy_device.set_axis(pyvjoy.HID_USAGE_X, axis_value)
-
-            offset_percentage = (delta_x / (self.screen_width // 2)) * 100
-            offset_percentage = max(min(offset_percentage, 100), -100)
+            axis_value, turn_angle, offset_percentage = _steer_compute(
+                float(x - self.center_x), self._sens_over_half, self._pct_scale)
+            if axis_value == self._last_axis:
+                return  # e.g. pure vertical motion: nothing to write or redraw
+            self._last_axis = axis_value
+            self._axis_mbox[0] = axis_value
+            self._axis_event.set()
+
             direction = 'Left' if offset_percentage < 0 else 'Right'
-            
-            self.update_indicator(turn_angle)
-            self.angle_label.config(text=f"Turn Angle: {round(turn_angle * 100, 2)}%")
-            self.offset_label.config(text=f"Offset: {round(offset_percentage, 2)}% {direction}")
 
-    def update_indicator(self, angle):
-        if angle < -0.1:
-            self.left_indicator.config(bg="#E74C3C", fg="white")
-            self.center_indicator.config(bg="#ECF0F1", fg="#27AE60")
-            self.right_indicator.config(bg="#ECF0F1", fg="#3498DB")
-        elif angle > 0.1:
-            self.left_indicator.config(bg="#ECF0F1", fg="#E74C3C")
-            self.center_indicator.config(bg="#ECF0F1", fg="#27AE60")
-            self.right_indicator.config(bg="#3498DB", fg="white")
-        else:
-            self.left_indicator.config(bg="#ECF0F1", fg="#E74C3C")
-            self.center_indicator.config(bg="#27AE60", fg="white")
-            self.right_indicator.config(bg="#ECF0F1", fg="#3498DB")
+            # Coalesce events: only the most recent state is drawn once Tk is idle
+            self._pending_state = (turn_angle, offset_percentage, direction)
+            if not self._ui_scheduled:
+                self._ui_scheduled = True
+                self.root.after_idle(self._flush_ui)
+
+    def _writer_loop(self):
+        while self._writer_alive:
+            self._axis_event.wait()
+            self._axis_event.clear()
+            value = self._axis_mbox[0]
+            if value is not None and self._writer_alive:
+                self._set_axis(self._hid_x, value)
+
+    def _flush_ui(self):
+        self._ui_scheduled = False
+        state = self._pending_state
+        if state is None:
+            return
+        turn_angle, offset_percentage, direction = state
+        self.update_indicator(turn_angle)
+        # Steady steering often rounds to the same text; skip the Tcl variable trace then
+        s = f"Turn Angle: {turn_angle * 100:.2f}%"
+        if s != self._last_angle_str:
+            self.angle_var.set(s)
+            self._last_angle_str = s
+        s = f"Offset: {offset_percentage:.2f}% {direction}"
+        if s != self._last_offset_str:
+            self.offset_var.set(s)
+            self._last_offset_str = s
 
+    def update_indicator(self, angle):
+        state = -1 if angle < -0.1 else (1 if angle > 0.1 else 0)
+        if state == self._ind_state:
+            return
+        self._ind_state = state
+        left, center, right = self._IND_STATES[state]
+        self.left_indicator.config(bg=left[0], fg=left[1])
+        self.center_indicator.config(bg=center[0], fg=center[1])
+        self.right_indicator.config(bg=right[0], fg=right[1])
+
+    @_throttle(33)
     def update_sensitivity(self, value):
         self.sensitivity = float(value)
+        self._sens_over_half = self.sensitivity * self._inv_half_w
         self.sensitivity_label.config(text=f"Sensitivity: {self.sensitivity}")
 
+    @_throttle(16)
     def update_opacity(self, value):
         opacity = float(value)
         self.root.attributes('-alpha', opacity)
 
     def change_theme(self, selected_theme):
+        self._ind_state = None  # The theme recolors the indicators; reapply the state on the next update
         if selected_theme == "Dark":
             self.root.configure(bg="#2C3E50")
             self.sensitivity_slider.configure(bg="#34495E", fg="white", troughcolor="#95A5A6")
@@ -215,11 +347,19 @@ class MouseSteeringApp:
             self.right_indicator.configure(bg="#ECF0F1", fg="#3498DB")
 
     def center_mouse(self):
-        # Center the mouse cursor on the screen
-        ctypes.windll.user32.SetCursorPos(self.center_x, self.center_y)
+        # Center the mouse cursor on the screen, unless it is already there
+        pt = self._cursor_pt
+        if (self._get_cursor_pos(ctypes.byref(pt))
+                and abs(pt.x - self.center_x) <= 1 and abs(pt.y - self.center_y) <= 1):
+            return
+        self._set_cursor_pos(self.center_x, self.center_y)
 
     def on_close(self):
         self.stop_steering()
+        if self._writer_thread is not None:
+            self._writer_alive = False
+            self._axis_event.set()
+            self._writer_thread.join()
         self.root.destroy()
 
 # Main application execution
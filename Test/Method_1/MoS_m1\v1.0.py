@@ -2,7 +2,6 @@ import pyvjoy
 import tkinter as tk
 from pynput import mouse as pynput_mouse
 import ctypes
-import time
 
 class MouseSteeringApp:
     def __init__(self, root):
@@ -12,6 +11,9 @@ class MouseSteeringApp:
         self.vjoy_device = None
         try:
             self.vjoy_device = pyvjoy.VJoyDevice(1)
+            # Bound once; on_move writes the axis on every mouse event
+            self._hid_x = pyvjoy.HID_USAGE_X
+            self._set_axis = self.vjoy_device.set_axis
         except pyvjoy.exceptions.vJoyFailedToAcquireException as e:
             print(f"Error acquiring vJoy device: {e}")
         
@@ -20,6 +22,10 @@ class MouseSteeringApp:
 
         self.update_center_position()  # Initialize center position
         self.create_widgets()
+        # Raw Tcl handles for the labels updated on every mouse event (skips Widget.config dispatch)
+        self._tk_call = self.root.tk.call
+        self._angle_w = str(self.angle_label)
+        self._offset_w = str(self.offset_label)
         self.center_mouse()            # Center mouse cursor at start
         self.mouse_listener = pynput_mouse.Listener(on_move=self.on_move)
 
@@ -72,7 +78,11 @@ class MouseSteeringApp:
         if not self.is_steering and self.vjoy_device:
             self.is_steering = True
             self.center_mouse()
-            time.sleep(0.1)  # Small delay to ensure the mouse position stabilizes
+            # Small delay to ensure the mouse position stabilizes, without blocking the Tk mainloop
+            self.root.after(100, self._start_listener)
+
+    def _start_listener(self):
+        if self.is_steering:  # Stop may have been pressed during the delay
             self.mouse_listener.start()
 
     def stop_steering(self):
@@ -90,7 +100,7 @@ class MouseSteeringApp:
             # Ensure turn_angle is within the range [-1, 1]
             turn_angle = max(min(turn_angle, 1), -1)
             axis_value = int((turn_angle + 1) * 16383)  # Map turn_angle [-1, 1] to axis_value [0, 32767]
-            self.vjoy_device.set_axis(pyvjoy.HID_USAGE_X, axis_value)
+            self._set_axis(self._hid_x, axis_value)
 
             # Calculate offset percentage with proper bounds
             offset_percentage = (delta_x / (self.screen_width // 2)) * 100
@@ -100,8 +110,8 @@ class MouseSteeringApp:
             direction = 'Left' if offset_percentage < 0 else 'Right'
             
             self.update_indicator(turn_angle)
-            self.angle_label.config(text=f"Turn Angle: {round(turn_angle * 100, 2)}%")
-            self.offset_label.config(text=f"Offset: {round(offset_percentage, 2)}% {direction}")
+            self._tk_call(self._angle_w, 'configure', '-text', f"Turn Angle: {round(turn_angle * 100, 2)}%")
+            self._tk_call(self._offset_w, 'configure', '-text', f"Offset: {round(offset_percentage, 2)}% {direction}")
 
     def update_indicator(self, angle):
         if angle < -0.1:
@@ -124,7 +134,6 @@ class MouseSteeringApp:
     def center_mouse(self):
         # Center the mouse cursor on the screen (Windows-specific)
         ctypes.windll.user32.SetCursorPos(self.center_x, self.center_y)
-        time.sleep(0.1)  # Ensure stability after centering
 
 if __name__ == "__main__":
     root = tk.Tk()
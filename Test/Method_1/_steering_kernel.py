@@ -0,0 +1,29 @@
+"""
+Per-event steering math for the Method_1 prototypes, JIT-compiled with Numba when available.
+"""
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit when Numba is not installed: returns the function unchanged."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True)
+def compute(delta_x, sens_over_half, pct_scale):
+    """Map a horizontal mouse offset to (vJoy axis value, turn angle, offset percentage)."""
+    turn_angle = delta_x * sens_over_half
+    if turn_angle > 1.0:
+        turn_angle = 1.0
+    elif turn_angle < -1.0:
+        turn_angle = -1.0
+    axis_value = int((turn_angle + 1.0) * 16383)  # Map [-1, 1] to [0, 32767]
+
+    offset_percentage = delta_x * pct_scale
+    if offset_percentage > 100.0:
+        offset_percentage = 100.0
+    elif offset_percentage < -100.0:
+        offset_percentage = -100.0
+    return axis_value, turn_angle, offset_percentage
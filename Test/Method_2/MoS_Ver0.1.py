@@ -1,62 +1,70 @@
-import pyautogui
-import time
+import ctypes
+from pynput import mouse
+
+# get_quadrant() returns ((x >= center_x) << 1) | (y >= center_y); names are indexed by that code
+_Q_NAMES = ("Left", "Bottom", "Top", "Right")
+
+def _pack_sequence(names):
+    # Last 4 transitions packed 2 bits per quadrant, oldest in the high bits
+    code = 0
+    for name in names:
+        code = (code << 2) | _Q_NAMES.index(name)
+    return code
+
+_CLOCKWISE = _pack_sequence(("Top", "Right", "Bottom", "Left"))
+_COUNTERCLOCKWISE = _pack_sequence(("Top", "Left", "Bottom", "Right"))
 
 class MouseSteering:
     def __init__(self):
-        self.screen_width, self.screen_height = pyautogui.size()
+        # Direct Win32 calls; pyautogui was only used for these two startup calls
+        user32 = ctypes.windll.user32
+        user32.SetProcessDPIAware()  # Physical pixels, matching pynput's coordinates
+        self.screen_width, self.screen_height = user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)
         self.center_x = self.screen_width // 2
         self.center_y = self.screen_height // 2
         self.prev_quadrant = None
         self.rotation_score = 0.0  # Tracks rotation progress
         self.current_direction = None  # "Clockwise" or "Counterclockwise"
-        self.sequence = []  # Stores quadrant transition history
+        self.sequence_code = 0  # Last 4 quadrant transitions (see _pack_sequence)
         
-        pyautogui.moveTo(self.center_x, 0)  # Start at top-center
+        user32.SetCursorPos(self.center_x, 0)  # Start at top-center
         self.track_mouse()
     
     def get_quadrant(self, x, y):
-        if y < self.center_y and x >= self.center_x:
-            return "Top"
-        elif x >= self.center_x and y >= self.center_y:
-            return "Right"
-        elif y >= self.center_y and x < self.center_x:
-            return "Bottom"
-        elif x < self.center_x and y < self.center_y:
-            return "Left"
+        return ((x >= self.center_x) << 1) | (y >= self.center_y)
     
     def track_mouse(self):
-        while True:
-            x, y = pyautogui.position()
-            current_quadrant = self.get_quadrant(x, y)
+        # Quadrant logic runs only on real mouse motion instead of polling position()
+        with mouse.Listener(on_move=self._process_sample) as listener:
+            listener.join()
+    
+    def _process_sample(self, x, y):
+        current_quadrant = self.get_quadrant(x, y)
+        
+        if current_quadrant != self.prev_quadrant:
+            self.sequence_code = ((self.sequence_code << 2) | current_quadrant) & 0xFF
             
-            if current_quadrant and current_quadrant != self.prev_quadrant:
-                self.sequence.append(current_quadrant)
-                
-                if len(self.sequence) > 4:
-                    self.sequence.pop(0)  # Keep only last 4 transitions
-                
-                if self.sequence == ["Top", "Right", "Bottom", "Left"]:
-                    new_direction = "Clockwise"
-                    if self.current_direction == "Counterclockwise":
-                        self.rotation_score -= 0.25  # Reduce counterclockwise progress
-                    else:
-                        self.rotation_score += 0.25
-                    self.sequence.clear()
-                elif self.sequence == ["Top", "Left", "Bottom", "Right"]:
-                    new_direction = "Counterclockwise"
-                    if self.current_direction == "Clockwise":
-                        self.rotation_score += 0.25  # Reduce clockwise progress
-                    else:
-                        self.rotation_score -= 0.25
-                    self.sequence.clear()
+            if self.sequence_code == _CLOCKWISE:
+                new_direction = "Clockwise"
+                if self.current_direction == "Counterclockwise":
+                    self.rotation_score -= 0.25  # Reduce counterclockwise progress
+                else:
+                    self.rotation_score += 0.25
+                self.sequence_code = 0
+            elif self.sequence_code == _COUNTERCLOCKWISE:
+                new_direction = "Counterclockwise"
+                if self.current_direction == "Clockwise":
+                    self.rotation_score += 0.25  # Reduce clockwise progress
                 else:
-                    new_direction = self.current_direction
-                
-                self.current_direction = new_direction
-                print(f"Rotation Score: {self.rotation_score:.2f} ({self.current_direction})")
-                
-            self.prev_quadrant = current_quadrant
-            time.sleep(0.05)
+                    self.rotation_score -= 0.25
+                self.sequence_code = 0
+            else:
+                new_direction = self.current_direction
+            
+            self.current_direction = new_direction
+            print(f"Rotation Score: {self.rotation_score:.2f} ({self.current_direction})")
+            
+        self.prev_quadrant = current_quadrant
 
 if __name__ == "__main__":
     MouseSteering()
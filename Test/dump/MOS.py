@@ -1,25 +1,33 @@
 import pyvjoy
-import math
+from math import atan2, cos, degrees, sin, sqrt
 from pynput import mouse as pynput_mouse
-from collections import deque
 
 class MouseSteering:
     def __init__(self, app):
         self.app = app
         self.sensitivity = 1.0
         self.offset = 0.0
+        self.dist2 = 0  # Squared distance from center; offset is derived from it only for display
         self.angle = 0.0
         self.previous_angle = 0.0  # Keep track of the last angle
         self.rotation_direction = "None"  # Track rotation direction
         self.clockwise_degrees = 0  # Track clockwise rotation
         self.counterclockwise_degrees = 0  # Track counterclockwise rotation
         self.device = pyvjoy.VJoyDevice(1)  # Assume vJoy device 1
+        # Bound once; on_move writes the axis on every mouse event
+        self._hid_x = pyvjoy.HID_USAGE_X
+        self._set_axis = self.device.set_axis
         self.mouse_listener = None
         self.direction_change_threshold = 10  # Set a threshold to prevent flickering
         self.max_degrees = 1080  # 3 full rotations (360° * 3)
         self.center_x = None  # Store center position for the mouse
         self.center_y = None  # Store center position for the mouse
-        self.angle_history = deque(maxlen=5)  # Store recent angle changes for smoothing
+        # Exponential moving average of the angle's unit vector, so smoothing is wrap-safe at +/-180
+        self.smoothing_factor = 0.3
+        self._ema_sin = 0.0
+        self._ema_cos = 1.0
+        self.smoothed_angle = 0.0
+        self._ui_pending = False  # A display refresh is already queued on the Tk thread
 
     def start_steering(self):
         """Start the mouse listener for steering"""
@@ -33,39 +41,51 @@ class MouseSteering:
 
     def on_move(self, x, y):
         """Handle mouse move event and calculate steering angle"""
+        _atan2, _degrees, _sin, _cos = atan2, degrees, sin, cos
         # Get the center of the screen
         if self.center_x is None or self.center_y is None:
             screen_width = self.app.root.winfo_screenwidth()
             screen_height = self.app.root.winfo_screenheight()
             self.center_x, self.center_y = screen_width // 2, screen_height // 2
 
-        # Calculate the offset (distance from center)
-        self.offset = math.sqrt((x - self.center_x) ** 2 + (y - self.center_y) ** 2)
+        # Squared distance from center (no sqrt needed for the threshold check)
+        dx = x - self.center_x
+        dy = y - self.center_y
+        self.dist2 = dx * dx + dy * dy
 
         # Calculate the angle
-        self.angle = math.degrees(math.atan2(y - self.center_y, x - self.center_x))
+        ang = _atan2(dy, dx)
+        self.angle = _degrees(ang)
 
-        # Add the angle to the history for smoothing
-        self.angle_history.append(self.angle)
-
-        # Get the smoothed angle using the moving average of recent values
-        smoothed_angle = sum(self.angle_history) / len(self.angle_history)
+        # Smooth on the sin/cos components so 179 and -179 average to 180, not 0
+        a = self.smoothing_factor
+        self._ema_sin += a * (_sin(ang) - self._ema_sin)
+        self._ema_cos += a * (_cos(ang) - self._ema_cos)
+        smoothed_angle = _degrees(_atan2(self._ema_sin, self._ema_cos))
+        self.smoothed_angle = smoothed_angle
 
         # Check if mouse is at the center
-        if self.offset < 10:  # Consider it centered if offset is less than 10 pixels
+        if self.dist2 < 100:  # Consider it centered if offset is less than 10 pixels
             self.reset_degrees()
 
         # Calculate the degrees and update direction
         self.calculate_rotation(smoothed_angle)
 
-        # Update the app's display
-        self.app.update_offset_and_angle(self.offset, smoothed_angle, self.rotation_direction,
-                                          self.clockwise_degrees, self.counterclockwise_degrees)
-
         # Map the calculated angle to vJoy input
-        self.device.set_axis(pyvjoy.HID_USAGE_X, int(smoothed_angle * self.sensitivity))
-        self.app.root.after(0, self.app.update_offset_and_angle, self.offset, smoothed_angle, self.rotation_direction,
-                        self.clockwise_degrees, self.counterclockwise_degrees)
+        self._set_axis(self._hid_x, int(smoothed_angle * self.sensitivity))
+
+        # Update the app's display on the Tk thread; events arriving before it runs share one refresh
+        if not self._ui_pending:
+            self._ui_pending = True
+            self.app.root.after(0, self._refresh_display)
+
+    def _refresh_display(self):
+        """Push the latest steering state to the app (runs on the Tk thread)"""
+        self._ui_pending = False
+        self.offset = sqrt(self.dist2)
+        self.app.update_offset_and_angle(self.offset, self.smoothed_angle, self.rotation_direction,
+                                         self.clockwise_degrees, self.counterclockwise_degrees)
+
     def calculate_rotation(self, smoothed_angle):
         """Calculate rotation direction and track degrees turned"""
         # Calculate delta angle (difference from previous angle)
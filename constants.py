@@ -1,8 +1,24 @@
 """
 Global constants for the Mouse Steering application.
 """
+from typing import NamedTuple
 
 # vJoy constants
 MAX_VJOY_AXIS = 32767  # Max value for a vJoy axis (0x7FFF)
 MIN_VJOY_AXIS = 0      # Min value for a vJoy axis
 CENTER_VJOY_AXIS = (MAX_VJOY_AXIS + MIN_VJOY_AXIS) // 2 # Center value for a vJoy axis
+
+
+class SteeringUpdate(NamedTuple):
+    """
+    Layout of the 'update_gui' payload. on_move passes the tuple returned by compute_step as is,
+    in this field order; the GUI unpacks it on its own thread.
+    """
+    offset_sq: float = 0.0 # Squared distance of mouse from center
+    raw_angle: float = 0.0 # Instantaneous angle of mouse
+    smoothed_angle: float = 0.0 # Smoothed angle of mouse
+    angular_velocity: float = 0.0
+    angular_acceleration: float = 0.0
+    total_accumulated_degrees: float = 0.0 # The "steering wheel" angle
+    vjoy_axis_value: int = CENTER_VJOY_AXIS # Current vJoy output
+    direction_code: int = 0 # Index into steering_kernel.DIRECTION_NAMES
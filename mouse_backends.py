@@ -0,0 +1,70 @@
+"""
+Mouse movement sources for SteeringLogic.
+
+Each backend delivers on_move(x, y) calls from its own thread between start() and stop().
+"""
+import os
+
+MOUSE_BACKEND_ENV = "MOS_MOUSE_BACKEND" # "pynput" (default) or "mouse"
+
+
+class PynputBackend:
+    """Mouse moves from a pynput listener thread."""
+    name = "pynput"
+
+    def __init__(self):
+        self._listener = None
+
+    def start(self, on_move):
+        from pynput import mouse as pynput_mouse
+        self._listener = pynput_mouse.Listener(on_move=on_move)
+        self._listener.start()
+
+    def stop(self):
+        if self._listener:
+            self._listener.stop()
+            self._listener = None # Allow garbage collection
+
+
+class MouseLibBackend:
+    """Mouse moves from the 'mouse' package's low-level hook. Requires 'pip install mouse'."""
+    name = "mouse"
+
+    def __init__(self):
+        import mouse # Fail at selection time rather than on first start
+        self._mouse = mouse
+        self._hook = None
+
+    def start(self, on_move):
+        move_event = self._mouse.MoveEvent
+
+        def hook(event):
+            if type(event) is move_event: # Skip button and wheel events
+                on_move(event.x, event.y)
+
+        self._hook = hook
+        self._mouse.hook(hook)
+
+    def stop(self):
+        if self._hook:
+            self._mouse.unhook(self._hook)
+            self._hook = None
+
+
+_BACKENDS = {cls.name: cls for cls in (PynputBackend, MouseLibBackend)}
+
+
+def make_mouse_backend(name=None):
+    """
+    Returns the backend called 'name', or the one selected by MOS_MOUSE_BACKEND (default pynput).
+    Falls back to pynput if the name is unknown or the backend's package is not installed.
+    """
+    name = (name or os.environ.get(MOUSE_BACKEND_ENV) or PynputBackend.name).lower()
+    if name not in _BACKENDS:
+        print(f"Unknown mouse backend '{name}' (expected one of {', '.join(_BACKENDS)}); using pynput.")
+        return PynputBackend()
+    try:
+        return _BACKENDS[name]()
+    except ImportError as e:
+        print(f"Mouse backend '{name}' unavailable ({e}); using pynput.")
+        return PynputBackend()
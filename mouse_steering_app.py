@@ -4,29 +4,87 @@
 # Constants are in constants.py.
 
 import tkinter as tk
-from tkinter import ttk, font, messagebox
+from tkinter import ttk # font and messagebox are imported where used, keeping module import light
 import ctypes # For DPI awareness
+import functools
+import math
+import os
+import queue
+import threading
 
+from steering_kernel import DIRECTION_NAMES
 from steering_logic import SteeringLogic
-from constants import CENTER_VJOY_AXIS # For initial GUI display if needed
+
+# Bound str.format methods for the data labels, built once instead of per update
+_FMT_DEG = "{:.2f}°".format
+_FMT_VEL = "{:.2f}°/event".format
+_FMT_ACC = "{:.2f}°/event²".format
+_FMT_OFF = "{:.2f} px".format
+
+# Data label rows refreshed by update_gui_elements: (data key, formatter).
+# update_gui_elements unpacks the values in this same order.
+_DATA_FIELDS = (
+    ("total_accumulated_degrees", _FMT_DEG),
+    ("rotation_direction", str),
+    ("angular_velocity", _FMT_VEL),
+    ("angular_acceleration", _FMT_ACC),
+    ("offset", _FMT_OFF),
+    ("smoothed_angle", _FMT_DEG),
+    ("vjoy_axis_value", str),
+)
+
+# Theme-specific colors, selected by apply_theme()
+_THEME_COLORS = {
+    "Dark": {
+        "bg": "#2B2B2B", "fg": "#BBBBBB", "widget_bg": "#3C3F41", # General background, foreground, widget backgrounds
+        "button_bg": "#4A4D4F", "button_fg": "#BBBBBB",           # Button colors
+        "accent": "#007ACC", "error": "#FF6B68", "success": "#A9DC76", # Accent (for data), error, success colors
+        "slider_trough": "#555555", "label_fg": "#E0E0E0"         # Slider trough color, specific label foreground
+    },
+    "Light": {
+        "bg": "#F0F0F0", "fg": "#333333", "widget_bg": "#FFFFFF",
+        "button_bg": "#E0E0E0", "button_fg": "#333333",
+        "accent": "#005FAF", "error": "#D32F2F", "success": "#388E3C", # Slightly adjusted accent for light theme
+        "slider_trough": "#CCCCCC", "label_fg": "#222222"
+    },
+}
+# ttk theme created for each color theme (see SteeringApp._ttk_theme_settings)
+_TTK_THEME_NAMES = {"Dark": "mos_dark", "Light": "mos_light"}
+
+@functools.cache
+def _ensure_dpi_aware():
+    """Attempts DPI awareness for sharper UI elements on Windows (once per process)."""
+    try:
+        ctypes.windll.shcore.SetProcessDpiAwareness(1) # Windows 8.1+
+    except AttributeError:
+        try: # Fallback for older Windows versions (Vista, 7)
+            ctypes.windll.user32.SetProcessDPIAware()
+        except AttributeError:
+            print("Warning: Could not set DPI awareness. UI might appear blurry on high DPI screens.")
 
 class SteeringApp:
     """
     The main Tkinter application class for the Mouse Steering Control.
     It provides the user interface and interacts with the SteeringLogic class.
     """
+    # Fixed attribute layout: the logic callbacks read these on every steering event.
+    __slots__ = (
+        'root', 'steering_logic', 'current_theme', 'fonts', 'colors',
+        'main_frame', 'control_frame', 'data_frame', 'settings_frame', 'status_theme_frame',
+        'start_button', 'recenter_button', 'theme_button',
+        'sensitivity_slider', 'opacity_slider', 'angle_progress',
+        'vjoy_status_label', 'app_status_label', 'error_banner', '_error_banner_timer',
+        'data_labels', 'data_vars', 'data_row_descriptors', '_last_values', '_label_setters',
+        '_pending_gui_data', '_flush_scheduled', '_steering_on', '_dispatch',
+        '_latest_gui', '_ctrl_q', '_wake_pending', '_wake_r', '_wake_w', '_tk_thread', '_poll_scheduled',
+        '_pb_px_per_unit', '_last_pb_value', '_sens_pending', '_last_sens_val',
+    )
+
     def __init__(self, root_window):
         self.root = root_window
         self.root.title("MoS - Mouse Steering Control")
 
-        # Attempt DPI Awareness for sharper UI elements on Windows
-        try:
-            ctypes.windll.shcore.SetProcessDpiAwareness(1) # Windows 8.1+
-        except AttributeError:
-            try: # Fallback for older Windows versions (Vista, 7)
-                ctypes.windll.user32.SetProcessDPIAware()
-            except AttributeError:
-                print("Warning: Could not set DPI awareness. UI might appear blurry on high DPI screens.")
+        _ensure_dpi_aware()
 
         # --- Window Setup ---
         window_width = 600
@@ -39,14 +97,50 @@ class SteeringApp:
         self.root.geometry(f'{window_width}x{window_height}+{position_left}+{position_top}')
         self.root.minsize(550, 650) # Minimum size to prevent layout issues
 
+        # 'update_gui' payload that arrived within the current frame, drawn when it ends (at most ~60 Hz)
+        self._pending_gui_data = None
+        self._flush_scheduled = False
+        self._steering_on = False # Steering state the start button currently shows
+
+        # handle_logic_callback handlers by SteeringLogic event type
+        self._dispatch = {
+            "update_gui": self._on_update_gui,
+            "status": self._on_status,
+            "vjoy_status": self._on_vjoy_status,
+            "error": self._on_error,
+        }
+
+        # SteeringLogic calls back from the pynput listener thread; events are queued there
+        # and handled on the Tk thread by _drain. 'update_gui' payloads go to a single latest-wins
+        # slot (stale ones are dropped under load); other events keep their order in _ctrl_q.
+        self._latest_gui = None
+        self._ctrl_q = queue.SimpleQueue()
+        # The Tk thread sleeps until an event is queued: a byte on a pipe watched by
+        # createfilehandler wakes it. Where Tk has no file handlers (Windows), other threads
+        # never call into Tcl; instead _poll drains on a Tk timer while steering or while
+        # events are queued, and events queued on the Tk thread itself start that timer.
+        self._wake_pending = False
+        self._tk_thread = threading.get_ident()
+        self._poll_scheduled = False
+        self._wake_r = self._wake_w = None
+        try:
+            self._wake_r, self._wake_w = os.pipe()
+            self.root.tk.createfilehandler(self._wake_r, tk.READABLE, self._on_wake)
+        except (AttributeError, OSError, tk.TclError):
+            for fd in (self._wake_r, self._wake_w):
+                if fd is not None:
+                    os.close(fd)
+            self._wake_r = self._wake_w = None
+
         # --- Initialize Steering Logic ---
-        # Pass the GUI's callback method to the SteeringLogic instance
-        self.steering_logic = SteeringLogic(app_callback=self.handle_logic_callback)
+        # Pass the GUI's (thread-safe) enqueue method to the SteeringLogic instance
+        self.steering_logic = SteeringLogic(app_callback=self._enqueue)
         # Provide the screen center to the logic (essential for angle calculations)
         self.steering_logic.set_screen_center(screen_width // 2, screen_height // 2)
 
         # --- Styling and Theming ---
         self.current_theme = "Dark" # Initial theme ("Dark" or "Light")
+        from tkinter import font
         self.fonts = {
             "default": font.Font(family="Segoe UI", size=10),
             "label": font.Font(family="Segoe UI", size=11, weight="bold"), # For descriptive labels
@@ -57,11 +151,14 @@ class SteeringApp:
 
         # --- Main UI Structure ---
         self.create_widgets() # Create all GUI elements
+        # (key, formatter, bound StringVar.set) per data row, so updates skip the dict/attribute lookups
+        self._label_setters = tuple((key, fmt, self.data_vars[key].set)
+                                    for key, fmt in _DATA_FIELDS)
         self.apply_theme()    # Apply the initial theme to all widgets
 
         # Update GUI with initial status from SteeringLogic
         initial_logic_status = self.steering_logic.get_status()
-        self.update_gui_elements(initial_logic_status)
+        self.update_gui_elements(self.steering_logic.get_current_update())
 
         # Explicitly call vjoy status update from logic to GUI
         # The vjoy_status_text key was added to get_status() in steering_logic.py
@@ -79,86 +176,56 @@ class SteeringApp:
 
     def apply_theme(self):
         """Applies the selected color theme (Dark/Light) to the GUI elements."""
-        if self.current_theme == "Dark":
-            self.colors = {
-                "bg": "#2B2B2B", "fg": "#BBBBBB", "widget_bg": "#3C3F41", # General background, foreground, widget backgrounds
-                "button_bg": "#4A4D4F", "button_fg": "#BBBBBB",           # Button colors
-                "accent": "#007ACC", "error": "#FF6B68", "success": "#A9DC76", # Accent (for data), error, success colors
-                "slider_trough": "#555555", "label_fg": "#E0E0E0"         # Slider trough color, specific label foreground
-            }
-        else: # Light Theme
-            self.colors = {
-                "bg": "#F0F0F0", "fg": "#333333", "widget_bg": "#FFFFFF",
-                "button_bg": "#E0E0E0", "button_fg": "#333333",
-                "accent": "#005FAF", "error": "#D32F2F", "success": "#388E3C", # Slightly adjusted accent for light theme
-                "slider_trough": "#CCCCCC", "label_fg": "#222222"
-            }
+        self.colors = _THEME_COLORS[self.current_theme]
 
         self.root.configure(bg=self.colors["bg"]) # Set root window background
 
-        # Configure ttk styles for consistent theming
+        # Each color theme is a ttk theme derived from 'clam' (better base for customisation than 'vista'
+        # or 'xpnative'), created on first use. Switching is then a single theme_use call instead of a
+        # configure/map call per style, each of which restyles every widget.
         s = ttk.Style()
-        s.theme_use('clam') # Using 'clam' or 'alt', 'default' as base for better customisation than 'vista' or 'xpnative'
-
-        s.configure("TFrame", background=self.colors["bg"])
-        s.configure("Main.TFrame", background=self.colors["bg"]) # Specific style for main content frames
-
-        s.configure("TButton", font=self.fonts["default"], padding=5,
-                    background=self.colors["button_bg"], foreground=self.colors["button_fg"])
-        s.map("TButton",
-              background=[('active', self.colors["accent"]), ('disabled', self.colors["widget_bg"])],
-              foreground=[('disabled', self.colors["fg"])])
-
-        s.configure("TLabel", background=self.colors["bg"], foreground=self.colors["fg"], font=self.fonts["default"])
-        s.configure("Status.TLabel", font=self.fonts["status"], background=self.colors["bg"], foreground=self.colors["fg"])
-        s.configure("Data.TLabel", font=self.fonts["data"], background=self.colors["bg"], foreground=self.colors["accent"])
-        s.configure("Header.TLabel", font=self.fonts["label"], background=self.colors["bg"], foreground=self.colors["label_fg"])
-
-        s.configure("TScale", troughcolor=self.colors["slider_trough"], background=self.colors["widget_bg"]) # Basic scale theming
-        s.map("TScale", background=[('active', self.colors["widget_bg"])])
-
-
-        s.configure("Horizontal.TProgressbar", troughcolor=self.colors["slider_trough"], background=self.colors["accent"], borderwidth=0)
-
-        # If widgets already exist, try to update their individual styles (important after theme toggle)
-        if hasattr(self, 'main_frame'):
-            self.main_frame.configure(style="Main.TFrame")
-            frames_to_update = [
-                getattr(self, name, None) for name in
-                ['control_frame', 'data_frame', 'settings_frame', 'status_theme_frame']
-            ]
-            for frame in frames_to_update:
-                if frame:
-                    frame.configure(style="Main.TFrame")
-                    for widget in frame.winfo_children():
-                        self.configure_widget_theme(widget)
-
-            self.update_data_labels_theme()
-            self.configure_widget_theme(self.angle_progress, "Horizontal.TProgressbar")
-            self.configure_widget_theme(self.sensitivity_slider, "TScale")
-            self.configure_widget_theme(self.opacity_slider, "TScale")
-            self.configure_widget_theme(self.start_button, "TButton")
-            self.configure_widget_theme(self.recenter_button, "TButton")
-            self.configure_widget_theme(self.theme_button, "TButton")
-            self.configure_widget_theme(self.vjoy_status_label, "Status.TLabel")
-            self.configure_widget_theme(self.app_status_label, "Status.TLabel")
-
-
-    def configure_widget_theme(self, widget, style_name=None):
-        """Helper to apply ttk style to a widget if it exists and is a ttk widget."""
-        if not widget: return
-        try:
-            if style_name:
-                widget.configure(style=style_name)
-            else:
-                if isinstance(widget, ttk.Button): widget.configure(style="TButton")
-                elif isinstance(widget, ttk.Label): widget.configure(style="TLabel")
-                elif isinstance(widget, ttk.Frame): widget.configure(style="TFrame")
-                elif isinstance(widget, ttk.Scale): widget.configure(style="TScale")
-                elif isinstance(widget, ttk.Progressbar): widget.configure(style="Horizontal.TProgressbar")
-
-        except tk.TclError:
-            pass
+        ttk_theme = _TTK_THEME_NAMES[self.current_theme]
+        if ttk_theme not in s.theme_names():
+            s.theme_create(ttk_theme, parent="clam", settings=self._ttk_theme_settings(self.colors))
+        s.theme_use(ttk_theme)
+
+    def _recolor_status_labels(self):
+        """
+        Re-applies the explicit foreground colors of the status labels and the error banner from the
+        new self.colors. theme_use restyles everything else; these colors override their style.
+        """
+        error = self.colors.get("error", "red")
+        self.error_banner.configure(foreground=error)
+        if str(self.app_status_label.cget("foreground")): # Left at the style's color until a status arrives
+            text = self.app_status_label.cget("text")
+            color = error if text.startswith("App Error") else self._app_status_color(text.removeprefix("App: "))
+            self.app_status_label.configure(foreground=color)
+        color = self._vjoy_status_color(self.vjoy_status_label.cget("text"))
+        if color:
+            self.vjoy_status_label.configure(foreground=color)
+
+    def _ttk_theme_settings(self, colors):
+        """Builds the ttk style settings (for Style.theme_create) of one color theme."""
+        return {
+            "TFrame": {"configure": {"background": colors["bg"]}},
+            "Main.TFrame": {"configure": {"background": colors["bg"]}}, # Specific style for main content frames
+            "TButton": {
+                "configure": {"font": self.fonts["default"], "padding": 5,
+                              "background": colors["button_bg"], "foreground": colors["button_fg"]},
+                "map": {"background": [('active', colors["accent"]), ('disabled', colors["widget_bg"])],
+                        "foreground": [('disabled', colors["fg"])]},
+            },
+            "TLabel": {"configure": {"background": colors["bg"], "foreground": colors["fg"], "font": self.fonts["default"]}},
+            "Status.TLabel": {"configure": {"font": self.fonts["status"], "background": colors["bg"], "foreground": colors["fg"]}},
+            "Data.TLabel": {"configure": {"font": self.fonts["data"], "background": colors["bg"], "foreground": colors["accent"]}},
+            "Header.TLabel": {"configure": {"font": self.fonts["label"], "background": colors["bg"], "foreground": colors["label_fg"]}},
+            "TScale": { # Basic scale theming
+                "configure": {"troughcolor": colors["slider_trough"], "background": colors["widget_bg"]},
+                "map": {"background": [('active', colors["widget_bg"])]},
+            },
+            "Horizontal.TProgressbar": {"configure": {"troughcolor": colors["slider_trough"], "background": colors["accent"],
+                                                      "borderwidth": 0}},
+        }
 
     def create_widgets(self):
         """Creates and lays out all GUI widgets."""
@@ -168,6 +235,11 @@ class SteeringApp:
         self.control_frame = ttk.Frame(self.main_frame, style="Main.TFrame")
         self.control_frame.pack(pady=(5,10), fill="x")
 
+        # Error banner shown above the controls by _on_error; hidden until needed, click to dismiss
+        self.error_banner = ttk.Label(self.main_frame, style="Data.TLabel", anchor="w", cursor="hand2")
+        self.error_banner.bind("<Button-1>", self._hide_error_banner)
+        self._error_banner_timer = None
+
         self.start_button = ttk.Button(self.control_frame, text="Start Steering", command=self.toggle_steering, width=15)
         self.start_button.pack(side="left", padx=5, expand=True, fill="x")
 
@@ -180,16 +252,21 @@ class SteeringApp:
 
         row_idx = 0
         self.data_labels = {}
+        self.data_vars = {}    # StringVar bound to each data label
+        self.data_row_descriptors = {} # Header label in front of each data label (and the progress bar)
+        self._last_values = {} # Text last pushed to each StringVar
 
         def add_data_row(text, key):
             nonlocal row_idx
             lbl_text = ttk.Label(self.data_frame, text=text, style="Header.TLabel")
             lbl_text.grid(row=row_idx, column=0, sticky="w", padx=5, pady=3)
 
-            val_text = "--"
-            lbl_value = ttk.Label(self.data_frame, text=val_text, style="Data.TLabel", anchor="e")
+            val_var = tk.StringVar(value="--")
+            lbl_value = ttk.Label(self.data_frame, textvariable=val_var, style="Data.TLabel", anchor="e")
             lbl_value.grid(row=row_idx, column=1, sticky="ew", padx=5, pady=3)
             self.data_labels[key] = lbl_value
+            self.data_vars[key] = val_var
+            self.data_row_descriptors[key] = lbl_text
             row_idx += 1
             return lbl_text, lbl_value
 
@@ -203,10 +280,15 @@ class SteeringApp:
 
         lbl_progress = ttk.Label(self.data_frame, text="Steering Wheel Position:", style="Header.TLabel")
         lbl_progress.grid(row=row_idx, column=0, sticky="w", padx=5, pady=(10,3))
+        self.data_row_descriptors["angle_progress"] = lbl_progress
         self.angle_progress = ttk.Progressbar(self.data_frame, orient="horizontal", length=300, mode="determinate",
                                               maximum=self.steering_logic.max_degrees * 2,
                                               value=self.steering_logic.max_degrees)
         self.angle_progress.grid(row=row_idx, column=1, sticky="ew", padx=5, pady=(10,3))
+        # Pixels per degree of bar value; the bar only redraws once the value moves a whole pixel
+        self._pb_px_per_unit = 300 / (self.steering_logic.max_degrees * 2)
+        self._last_pb_value = self.steering_logic.max_degrees
+        self.angle_progress.bind("<Configure>", self._on_progress_resize)
         row_idx +=1
 
         self.settings_frame = ttk.Frame(self.main_frame, style="Main.TFrame")
@@ -217,7 +299,9 @@ class SteeringApp:
         lbl_sensitivity.grid(row=0, column=0, padx=5, pady=5, sticky="w")
         self.sensitivity_slider = ttk.Scale(self.settings_frame, from_=0.1, to=5.0, orient=tk.HORIZONTAL,
                                            value=self.steering_logic.sensitivity,
-                                           command=lambda s_val: self.steering_logic.update_sensitivity(float(s_val)))
+                                           command=self._on_sens_change)
+        self._sens_pending = None  # after() id of the pending sensitivity commit
+        self._last_sens_val = self.steering_logic.sensitivity
         self.sensitivity_slider.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
 
         lbl_opacity = ttk.Label(self.settings_frame, text="Window Opacity:", style="Header.TLabel")
@@ -238,34 +322,15 @@ class SteeringApp:
         self.theme_button = ttk.Button(self.status_theme_frame, text="Toggle Theme", command=self.toggle_theme, width=15)
         self.theme_button.pack(side="right", padx=5)
 
-    def update_data_labels_theme(self):
-        """Specifically updates theme colors for data labels after a theme change."""
-        if not hasattr(self, 'data_labels'):
-            return
-        for key, label_widget in self.data_labels.items():
-            try:
-                label_widget.configure(style="Data.TLabel")
-                parent_frame = label_widget.master
-                row_info = label_widget.grid_info()["row"]
-                descriptor_label = parent_frame.grid_slaves(row=row_info, column=0)[0]
-                descriptor_label.configure(style="Header.TLabel")
-            except (tk.TclError, IndexError, AttributeError):
-                 pass
-
-        if hasattr(self, 'angle_progress'):
-            parent_frame = self.angle_progress.master
-            row_info = self.angle_progress.grid_info()["row"]
-            try:
-                descriptor_label = parent_frame.grid_slaves(row=row_info, column=0)[0]
-                descriptor_label.configure(style="Header.TLabel")
-            except (tk.TclError, IndexError, AttributeError):
-                pass
-
+    def _on_progress_resize(self, event):
+        """Keeps the progress bar's pixels-per-degree in step with its stretched (sticky="ew") width."""
+        self._pb_px_per_unit = event.width / (self.steering_logic.max_degrees * 2)
 
     def toggle_theme(self):
         """Switches between Dark and Light themes and applies changes."""
         self.current_theme = "Light" if self.current_theme == "Dark" else "Dark"
         self.apply_theme()
+        self._recolor_status_labels()
 
     def toggle_steering(self):
         """Starts or stops the steering logic based on its current state."""
@@ -273,10 +338,21 @@ class SteeringApp:
             self.steering_logic.stop_steering()
         else:
             if not self.steering_logic.vjoy_device:
+                 from tkinter import messagebox # Only needed on this error path
                  messagebox.showerror("vJoy Error", "vJoy device not available. Cannot start steering.")
                  return
             self.steering_logic.start_steering()
 
+    def _on_sens_change(self, s_val):
+        """Slider command: remembers the value and commits it to SteeringLogic at most every 50 ms."""
+        self._last_sens_val = float(s_val)
+        if self._sens_pending is None:
+            self._sens_pending = self.root.after(50, self._commit_sens)
+
+    def _commit_sens(self):
+        self._sens_pending = None
+        self.steering_logic.update_sensitivity(self._last_sens_val)
+
     def update_opacity(self, value_str):
         """Updates the window opacity based on the slider value."""
         try:
@@ -288,61 +364,172 @@ class SteeringApp:
     def update_gui_elements(self, data):
         """
         Updates all relevant GUI labels and progress bar with data received from SteeringLogic.
-        'data' is a dictionary typically received from the 'update_gui' callback or get_status().
+        'data' is a tuple in SteeringUpdate's field order: the compute_step result sent with
+        'update_gui', or get_current_update().
         """
         if not hasattr(self, 'data_labels'): return
 
-        self.data_labels["total_accumulated_degrees"].config(text=f"{data.get('total_accumulated_degrees', 0.0):.2f}°")
-        self.data_labels["rotation_direction"].config(text=str(data.get('rotation_direction', 'None')))
-        self.data_labels["angular_velocity"].config(text=f"{data.get('angular_velocity', 0.0):.2f}°/event")
-        self.data_labels["angular_acceleration"].config(text=f"{data.get('angular_acceleration', 0.0):.2f}°/event²")
-        self.data_labels["offset"].config(text=f"{data.get('offset', 0.0):.2f} px")
-        self.data_labels["smoothed_angle"].config(text=f"{data.get('smoothed_angle', 0.0):.2f}°")
-        # Use CENTER_VJOY_AXIS for default if key is missing (e.g. from initial get_status)
-        self.data_labels["vjoy_axis_value"].config(text=str(data.get('vjoy_axis_value', CENTER_VJOY_AXIS)))
-
-        progress_val = data.get('total_accumulated_degrees', 0.0) + self.steering_logic.max_degrees
-        self.angle_progress['value'] = progress_val
-
-        current_steering_status = data.get('is_steering', self.steering_logic.is_steering) # Prefer data if available
-        if current_steering_status and self.start_button.cget('text') != "Stop Steering":
-            self.start_button.configure(text="Stop Steering")
-        elif not current_steering_status and self.start_button.cget('text') != "Start Steering":
-            self.start_button.configure(text="Start Steering")
+        # Unpacked once on the Tk thread; the progress bar reuses these locals
+        offset_sq, _, sa, av, aa, tad, vav, direction_code = data
+        rd = DIRECTION_NAMES[direction_code]
+        off = math.sqrt(offset_sq)
+
+        # Only push text that changed; steady steering often formats to the same strings
+        last_values = self._last_values
+        for (key, fmt, set_text), value in zip(self._label_setters, (tad, rd, av, aa, off, sa, vav)):
+            new_text = fmt(value)
+            if last_values.get(key) != new_text:
+                set_text(new_text)
+                last_values[key] = new_text
+
+        progress_val = tad + self.steering_logic.max_degrees
+        if abs(progress_val - self._last_pb_value) * self._pb_px_per_unit >= 1.0:
+            self.angle_progress['value'] = progress_val
+            self._last_pb_value = progress_val
+
+        self._sync_start_button()
+
+    def _sync_start_button(self):
+        """Shows "Stop Steering" or "Start Steering" on the start button to match SteeringLogic."""
+        current_steering_status = self.steering_logic.is_steering
+        if current_steering_status != self._steering_on:
+            self._steering_on = current_steering_status
+            self.start_button.configure(text="Stop Steering" if current_steering_status else "Start Steering")
+
+    def _enqueue(self, event_type, data):
+        """SteeringLogic callback: may run on any thread, so it only queues the event."""
+        if event_type == "update_gui":
+            self._latest_gui = data # Overwrites any payload not yet drawn
+        else:
+            self._ctrl_q.put_nowait((event_type, data))
+        if self._wake_w is None:
+            if threading.get_ident() == self._tk_thread and not self._wake_pending:
+                self._schedule_poll()
+            # Other threads only queue: the running _poll picks the event up
+        elif not self._wake_pending:
+            self._wake_pending = True
+            os.write(self._wake_w, b"\0")
+
+    def _on_wake(self, fd, mask):
+        """Tk file handler for the wake-up pipe."""
+        os.read(fd, 512)
+        self._drain()
+
+    def _schedule_poll(self):
+        """Tk thread only: starts the _poll timer used when there is no wake-up pipe."""
+        if not self._poll_scheduled:
+            self._poll_scheduled = True
+            self.root.after(16, self._poll)
+
+    def _poll(self):
+        """Drains queued events; keeps polling only while steering runs or events are still queued."""
+        self._poll_scheduled = False
+        self._drain()
+        if self.steering_logic.is_steering or self._latest_gui is not None or not self._ctrl_q.empty():
+            self._schedule_poll()
+
+    def _drain(self):
+        """Handles all queued SteeringLogic events on the Tk thread, woken by the pipe or run by _poll."""
+        # Cleared before draining, so an event queued meanwhile either gets drained now or wakes us again
+        self._wake_pending = False
+        data, self._latest_gui = self._latest_gui, None
+        if data is not None:
+            self._on_update_gui(data)
+        while True:
+            try:
+                event_type, data = self._ctrl_q.get_nowait()
+            except queue.Empty:
+                break
+            self.handle_logic_callback(event_type, data)
 
     def handle_logic_callback(self, event_type, data):
         """
-        Handles callbacks from the SteeringLogic instance.
+        Handles callbacks from the SteeringLogic instance (called on the Tk thread by _drain).
         Updates GUI elements based on the event type and data received.
         """
-        if event_type == "update_gui":
-            self.update_gui_elements(data)
-        elif event_type == "status":
-            self.app_status_label.config(text=f"App: {data}")
-            if data == "Steering Active":
-                self.app_status_label.config(foreground=self.colors.get("success", "green"))
-            elif data == "Steering Stopped" or data == "View Recentered":
-                 self.app_status_label.config(foreground=self.colors.get("fg", "black"))
-            else:
-                self.app_status_label.config(foreground=self.colors.get("accent", "blue"))
-
-        elif event_type == "vjoy_status":
-            self.vjoy_status_label.config(text=f"vJoy: {data}")
-            if "Error" in data or "Not Found" in data:
-                self.vjoy_status_label.config(foreground=self.colors.get("error", "red"))
-                self.start_button.config(state=tk.DISABLED)
-            elif "Connected" in data :
-                self.vjoy_status_label.config(foreground=self.colors.get("success", "green"))
-                self.start_button.config(state=tk.NORMAL)
-        elif event_type == "error":
-            messagebox.showerror("Steering Logic Error", str(data))
-            self.app_status_label.config(text=f"App Error (see popup)", foreground=self.colors.get("error", "red"))
+        handler = self._dispatch.get(event_type)
+        if handler:
+            handler(data)
+
+    def _on_update_gui(self, data):
+        # Steering events can arrive at mouse poll rate: draw the first one right away, then keep
+        # only the newest for the rest of the frame, so redraws stay at ~60 Hz without adding a frame of lag
+        if self._flush_scheduled:
+            self._pending_gui_data = data
+            return
+        self.update_gui_elements(data)
+        self._flush_scheduled = True
+        self.root.after(16, self._flush_gui)
+
+    # Status changes are low priority: their label updates are deferred to Tk's idle time so
+    # they never hold up the steering updates being handled.
+
+    def _app_status_color(self, data):
+        """Foreground color of the app status label for status text 'data'."""
+        if data == "Steering Active":
+            return self.colors.get("success", "green")
+        if data == "Steering Stopped" or data == "View Recentered":
+            return self.colors.get("fg", "black")
+        return self.colors.get("accent", "blue")
+
+    def _vjoy_status_color(self, data):
+        """Foreground color _on_vjoy_status gives the vJoy status label for 'data', or None if it sets none."""
+        if "Error" in data or "Not Found" in data:
+            return self.colors.get("error", "red")
+        if "Connected" in data:
+            return self.colors.get("success", "green")
+        return None
+
+    def _on_status(self, data):
+        color = self._app_status_color(data)
+        self._sync_start_button() # Start and stop are reported here; no update_gui follows a stop
+        self.root.after_idle(functools.partial(self.app_status_label.config, text=f"App: {data}", foreground=color))
+
+    def _on_vjoy_status(self, data):
+        after_idle = self.root.after_idle
+        after_idle(functools.partial(self.vjoy_status_label.config, text=f"vJoy: {data}"))
+        if "Error" in data or "Not Found" in data:
+            after_idle(functools.partial(self.vjoy_status_label.config, foreground=self.colors.get("error", "red")))
+            after_idle(functools.partial(self.start_button.config, state=tk.DISABLED))
+        elif "Connected" in data :
+            after_idle(functools.partial(self.vjoy_status_label.config, foreground=self.colors.get("success", "green")))
+            after_idle(functools.partial(self.start_button.config, state=tk.NORMAL))
+
+    def _on_error(self, data):
+        # In-window banner instead of a modal messagebox, whose nested event loop would stall event handling
+        if self._error_banner_timer is not None:
+            self.root.after_cancel(self._error_banner_timer)
+        self.error_banner.configure(text=f"⚠ {data}", foreground=self.colors.get("error", "red"))
+        self.error_banner.pack(side="top", fill="x", before=self.control_frame)
+        self._error_banner_timer = self.root.after(5000, self._hide_error_banner)
+        self.root.after_idle(functools.partial(self.app_status_label.config, text="App Error (see banner)",
+                                               foreground=self.colors.get("error", "red")))
+
+    def _hide_error_banner(self, event=None):
+        """Hides the error banner (after its timeout or when clicked)."""
+        if self._error_banner_timer is not None:
+            self.root.after_cancel(self._error_banner_timer)
+            self._error_banner_timer = None
+        self.error_banner.pack_forget()
+
+    def _flush_gui(self):
+        """Ends the frame started by _on_update_gui, drawing the payload that arrived during it."""
+        self._flush_scheduled = False
+        data, self._pending_gui_data = self._pending_gui_data, None
+        if data is not None:
+            self._on_update_gui(data) # Draws now and starts the next frame
 
     def on_close(self):
         """Handles the window close event for graceful shutdown."""
         print("Closing application via window 'X' button...")
         if self.steering_logic:
             self.steering_logic.close()
+        self._wake_pending = True # Late events from the listener thread must not wake a destroyed root
+        if self._wake_r is not None:
+            self.root.tk.deletefilehandler(self._wake_r)
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+            self._wake_r = self._wake_w = None
         self.root.destroy()
 
 if __name__ == "__main__":
@@ -356,4 +543,3 @@ if __name__ == "__main__":
         print("Skipping GUI, running SteeringLogic CLI test (ensure `run_gui_app` is False)...")
         print("To run CLI test for SteeringLogic, ensure it has its own executable __main__ or modify this section.")
 
-```
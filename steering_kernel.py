@@ -0,0 +1,74 @@
+"""
+Per-event numeric core of SteeringLogic.on_move, JIT-compiled with Numba when available.
+"""
+import math
+
+from constants import MAX_VJOY_AXIS, MIN_VJOY_AXIS
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit when Numba is not installed: returns the function unchanged."""
+        def decorator(func):
+            return func
+        return decorator
+
+_DEG_PER_RAD = 180.0 / math.pi # Folded into one multiply instead of a math.degrees call
+
+# Index into this with the direction code returned by compute_step (-1 picks the last entry)
+DIRECTION_NAMES = ("None", "Clockwise", "Counterclockwise")
+
+
+def axis_scaling(max_deg):
+    """Returns (axis_scale, axis_offset) so axis = accum * axis_scale + axis_offset maps [-max_deg, max_deg] onto the vJoy range."""
+    axis_range = MAX_VJOY_AXIS - MIN_VJOY_AXIS
+    if max_deg == 0: # Avoid division by zero: the axis stays centered
+        return 0.0, MIN_VJOY_AXIS + 0.5 * axis_range
+    return axis_range / (2.0 * max_deg), MIN_VJOY_AXIS + 0.5 * axis_range
+
+
+# Explicit signature so Numba compiles at import instead of on the first mouse event:
+# eight results (six float64, then axis_value and direction_code as int64) from eleven float64 arguments
+_COMPUTE_STEP_SIG = ("Tuple((float64, float64, float64, float64, float64, float64, int64, int64))"
+                     "(float64, float64, float64, float64, float64, float64,"
+                     " float64, float64, float64, float64, float64)")
+
+
+@njit(_COMPUTE_STEP_SIG, cache=True, fastmath=True)
+def compute_step(dx, dy, prev_smoothed, alpha, prev_vel,
+                 accum, max_deg, direction_thresh, center_thresh_sq, axis_scale, axis_offset):
+    """
+    Processes one mouse sample at offset (dx, dy) from the screen center.
+    'prev_smoothed' is the exponential moving average of the raw angle so far, 'alpha' its weight
+    for the new sample. 'axis_scale'/'axis_offset' come from axis_scaling(max_deg).
+    Returns (offset_sq, raw_angle, smoothed_angle, angular_velocity, angular_acceleration,
+    accumulated_degrees, axis_value, direction_code),
+    where direction_code is 1 for clockwise, -1 for counter-clockwise and 0 for none.
+    """
+    offset_sq = dx * dx + dy * dy
+    raw_angle = math.atan2(dy, dx) * _DEG_PER_RAD
+
+    # One-pole smoothing along the shortest arc: the raw-to-average gap is wrapped into
+    # [-180, 180) without branching, so the average never swings the long way round
+    gap = raw_angle - prev_smoothed
+    gap -= 360.0 * math.floor((gap + 180.0) / 360.0)
+    delta = alpha * gap # Change of the smoothed angle; already within ±180°
+    smoothed = prev_smoothed + delta
+    smoothed -= 360.0 * math.floor((smoothed + 180.0) / 360.0)
+    accel = delta - prev_vel
+
+    # Near the center counts as neutral input; tiny deltas are treated as jitter.
+    # Computed from comparisons instead of an if/elif chain: -1, 0 or 1.
+    active = (offset_sq >= center_thresh_sq) & (abs(delta) > direction_thresh)
+    direction = int(active) * (int(delta > 0.0) - int(delta < 0.0))
+    accum = min(max_deg, max(-max_deg, accum + direction * abs(delta))) # Accumulate and clamp to the lock
+
+    # Scale [-max_deg, max_deg] to [MIN_VJOY_AXIS, MAX_VJOY_AXIS]
+    axis_value = int(accum * axis_scale + axis_offset)
+    if axis_value > MAX_VJOY_AXIS:
+        axis_value = MAX_VJOY_AXIS
+    elif axis_value < MIN_VJOY_AXIS:
+        axis_value = MIN_VJOY_AXIS
+
+    return offset_sq, raw_angle, smoothed, delta, accel, accum, axis_value, direction
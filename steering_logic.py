@@ -1,17 +1,19 @@
 import math
+import threading
 import time # For performance measurement if needed
-from collections import deque
-import pyvjoy
-from pynput import mouse as pynput_mouse
+from mouse_backends import make_mouse_backend
 
-from constants import MAX_VJOY_AXIS, MIN_VJOY_AXIS, CENTER_VJOY_AXIS
+from constants import CENTER_VJOY_AXIS, SteeringUpdate
+from steering_kernel import DIRECTION_NAMES, axis_scaling, compute_step
+
+EMA_ALPHA = 0.4 # Weight of each new raw angle in the smoothed angle at sensitivity 1.0
 
 class SteeringLogic:
     """
     Handles the core logic for mouse steering, including mouse input processing,
     angle calculations, vJoy output, and communication with the GUI.
     """
-    def __init__(self, app_callback=None):
+    def __init__(self, app_callback=None, mouse_backend=None):
         self.app_callback = app_callback  # Callback function to send data/status to the GUI
 
         # Steering parameters
@@ -19,6 +21,8 @@ class SteeringLogic:
         self.max_degrees = 1080  # Max steering lock: 3 full rotations (3 * 360°)
         self.direction_change_threshold = 1.0  # Degrees: Min change to detect rotation; adjusted from 10
         self.mouse_center_threshold = 15  # Pixels: Radius to consider mouse as centered
+        self._center_thresh_sq = self.mouse_center_threshold ** 2 # Compared against the squared offset
+        self._refresh_axis_scaling()
 
         # State variables
         self.current_raw_angle = 0.0  # Current angle from atan2
@@ -26,9 +30,9 @@ class SteeringLogic:
 
         self.total_accumulated_degrees = 0.0 # Net rotation: positive for clockwise, negative for counter-clockwise
 
-        self.rotation_direction = "None"  # "Clockwise", "Counterclockwise", or "None"
+        self._direction_code = 0 # Per-event direction from compute_step: 1, -1 or 0 (see rotation_direction)
 
-        self.current_offset = 0.0 # Distance of mouse from center
+        self._offset_sq = 0.0 # Squared distance of mouse from center (see current_offset)
 
         self.angular_velocity = 0.0 # Degrees per event
         self.previous_angular_velocity = 0.0
@@ -38,14 +42,25 @@ class SteeringLogic:
         self.screen_center_x = None
         self.screen_center_y = None
 
+        self._last_xy = None # Last (x, y) seen by on_move; only valid while the listener runs
+
         # Smoothing
-        self.angle_history = deque(maxlen=5) # For smoothing raw angle
+        # Exponential moving average of the raw angle; previous_smoothed_angle holds its state
+        self._alpha = EMA_ALPHA
         self.last_event_time = None
 
+        # Output throttling: state is updated on every event and vJoy only gets changed values.
+        # Every step goes to the GUI, which keeps only the newest and redraws once per frame.
+        self._last_axis_value = None # Last value written to vJoy (None: unknown)
+
         # vJoy and mouse listener
         self.vjoy_device = None
-        self.mouse_listener = None
+        self._hid_x = None # pyvjoy.HID_USAGE_X, set once pyvjoy is imported
+        # Source of on_move events: "pynput" or "mouse"; None reads MOS_MOUSE_BACKEND (default pynput)
+        self._listener_backend = make_mouse_backend(mouse_backend)
         self.is_steering = False
+        self._stop_event = threading.Event() # Set whenever steering is not active
+        self._stop_event.set()
 
         self._initialize_vjoy()
 
@@ -55,9 +70,19 @@ class SteeringLogic:
         Attempts to acquire vJoy device 1 and sets its X-axis to center.
         Notifies the GUI about the connection status.
         """
+        try:
+            import pyvjoy # Loaded here so importing this module stays cheap
+        except ImportError as e:
+            print(f"pyvjoy is not available: {e}")
+            self.vjoy_device = None
+            if self.app_callback:
+                self.app_callback("vjoy_status", "vJoy Not Found or Error")
+            return
+        self._hid_x = pyvjoy.HID_USAGE_X
         try:
             self.vjoy_device = pyvjoy.VJoyDevice(1)
-            self.vjoy_device.set_axis(pyvjoy.HID_USAGE_X, CENTER_VJOY_AXIS) # Center on init
+            self.vjoy_device.set_axis(self._hid_x, CENTER_VJOY_AXIS) # Center on init
+            self._last_axis_value = CENTER_VJOY_AXIS
             print("vJoy device initialized and centered.")
             if self.app_callback:
                 self.app_callback("vjoy_status", "vJoy Connected")
@@ -82,13 +107,29 @@ class SteeringLogic:
         self.screen_center_y = center_y
         # Reset angles when screen center is defined/redefined to prevent jumps
         # Initialize with current mouse pos relative to new center
-        current_mouse_pos = pyvjoy.utils.get_mouse_position() # pynput might be better if listener can be temporarily used
-        self.previous_smoothed_angle = self._calculate_raw_angle(current_mouse_pos['x'], current_mouse_pos['y'])
-        self.angle_history.clear()
-        for _ in range(self.angle_history.maxlen): # Fill history to avoid jerky start
-            self.angle_history.append(self.previous_smoothed_angle)
+        # Seed the smoother at the current angle to avoid a jerky start
+        try:
+            self.previous_smoothed_angle = self._calculate_raw_angle(*self._mouse_position())
+        except Exception as e: # The OS cursor query can fail, e.g. without a display
+            print(f"Could not get mouse position for screen center: {e}")
+            self.previous_smoothed_angle = 0.0
 
 
+    def _mouse_position(self):
+        """
+        Returns the current (x, y) mouse position. Uses the last on_move sample while steering
+        and only asks the OS for the cursor position when no sample is available.
+        """
+        if self._last_xy is not None:
+            return self._last_xy
+        from pynput import mouse as pynput_mouse
+        x, y = pynput_mouse.Controller().position
+        return x, y
+
+    def _refresh_axis_scaling(self):
+        """Recomputes the degrees-to-vJoy mapping constants; call again after changing max_degrees."""
+        self._axis_scale, self._axis_offset = axis_scaling(self.max_degrees)
+
     def _calculate_raw_angle(self, x, y):
         """Calculates the raw angle of the mouse position (x, y) relative to the screen center."""
         if self.screen_center_x is None or self.screen_center_y is None:
@@ -100,7 +141,7 @@ class SteeringLogic:
     def start_steering(self):
         """
         Starts the mouse steering process.
-        Initializes state variables and starts the pynput mouse listener.
+        Initializes state variables and starts the mouse listener backend.
         """
         if self.is_steering:
             print("Steering already active.")
@@ -120,20 +161,17 @@ class SteeringLogic:
             return
 
         self.is_steering = True
+        self._stop_event.clear()
         # Reset state variables
         # Keep total_accumulated_degrees unless explicitly reset by user
-        self.previous_smoothed_angle = self._calculate_raw_angle(pyvjoy.utils.get_mouse_position()['x'], pyvjoy.utils.get_mouse_position()['y'])
-        self.angle_history.clear()
-        for _ in range(self.angle_history.maxlen):
-             self.angle_history.append(self.previous_smoothed_angle)
+        self.previous_smoothed_angle = self._calculate_raw_angle(*self._mouse_position())
         self.angular_velocity = 0.0
         self.previous_angular_velocity = 0.0
         self.angular_acceleration = 0.0
-        self.rotation_direction = "None"
+        self._direction_code = 0
         self.last_event_time = time.perf_counter()
 
-        self.mouse_listener = pynput_mouse.Listener(on_move=self.on_move)
-        self.mouse_listener.start()
+        self._listener_backend.start(self.on_move)
         print("Steering started.")
         if self.app_callback:
             self.app_callback("status", "Steering Active")
@@ -149,12 +187,13 @@ class SteeringLogic:
             return
 
         self.is_steering = False
-        if self.mouse_listener:
-            self.mouse_listener.stop()
-            self.mouse_listener = None # Allow garbage collection
+        self._listener_backend.stop()
+        self._stop_event.set()
+        self._last_xy = None # The mouse moves unobserved from now on
 
-        if self.vjoy_device:
-            self.vjoy_device.set_axis(pyvjoy.HID_USAGE_X, CENTER_VJOY_AXIS) # Center vJoy on stop
+        if self.vjoy_device and self._last_axis_value != CENTER_VJOY_AXIS:
+            self.vjoy_device.set_axis(self._hid_x, CENTER_VJOY_AXIS) # Center vJoy on stop
+        self._last_axis_value = CENTER_VJOY_AXIS
 
         self.angular_velocity = 0.0
         self.angular_acceleration = 0.0
@@ -165,7 +204,7 @@ class SteeringLogic:
 
     def on_move(self, x, y):
         """
-        Callback function for mouse movement events from pynput listener.
+        Callback function for mouse movement events from the listener backend.
         This is the core of the steering logic, processing mouse input to update steering state.
         Parameters:
             x (int): Current mouse x-coordinate.
@@ -173,89 +212,35 @@ class SteeringLogic:
         """
         if not self.is_steering or self.screen_center_x is None:
             return
+        self._last_xy = (x, y)
 
         # Optional: Calculate time delta for more accurate physics if needed.
         # current_time = time.perf_counter()
         # time_delta = current_time - (self.last_event_time if self.last_event_time else current_time)
         # self.last_event_time = current_time
 
-        # 1. Calculate Offset from screen center
-        self.current_offset = math.sqrt((x - self.screen_center_x)**2 + (y - self.screen_center_y)**2)
-
-        # 2. Calculate Raw Angle and apply Smoothing
-        self.current_raw_angle = self._calculate_raw_angle(x, y)
-        self.angle_history.append(self.current_raw_angle) # Add current angle to history deque
-        current_smoothed_angle = sum(self.angle_history) / len(self.angle_history) # Moving average
-
-        # 3. Calculate Delta Angle (change in angle since last event)
-        # This serves as a proxy for angular velocity for the current discrete mouse event.
-        delta_angle = current_smoothed_angle - self.previous_smoothed_angle
-
-        # Normalize delta_angle to handle angle wrap-around (e.g., from -170 to +170 degrees is a 20 deg change, not 340)
-        if delta_angle > 180: # Clockwise wrap
-            delta_angle -= 360
-        elif delta_angle < -180: # Counter-clockwise wrap
-            delta_angle += 360
-
+        # 1-5. Offset, raw angle, smoothing, velocity/acceleration, accumulation and axis scaling
+        step = compute_step(
+            float(x - self.screen_center_x), float(y - self.screen_center_y),
+            self.previous_smoothed_angle, self._alpha, self.previous_angular_velocity,
+            self.total_accumulated_degrees, float(self.max_degrees),
+            self.direction_change_threshold, float(self._center_thresh_sq),
+            self._axis_scale, self._axis_offset)
+        (self._offset_sq, self.current_raw_angle, current_smoothed_angle, delta_angle,
+         self.angular_acceleration, self.total_accumulated_degrees, axis_value, self._direction_code) = step
         self.angular_velocity = delta_angle # Degrees per mouse event
-
-        # 4. Calculate Angular Acceleration (change in angular velocity)
-        self.angular_acceleration = self.angular_velocity - self.previous_angular_velocity
-        self.previous_angular_velocity = self.angular_velocity # Store current velocity for next event's acceleration calc
-
-        # 5. Update Rotation Direction and Accumulated Steering Degrees
-        if self.current_offset < self.mouse_center_threshold:
-            # If mouse is physically near the screen center, consider it neutral input for rotation.
-            # This helps prevent drift when the user intends to stop turning but mouse isn't perfectly still.
-            self.rotation_direction = "None"
-            # Note: total_accumulated_degrees is not reset here; user must use "Recenter View" or stop/start.
-        elif delta_angle > self.direction_change_threshold: # Clockwise movement
-            self.rotation_direction = "Clockwise"
-            self.total_accumulated_degrees += abs(delta_angle) # Accumulate positive degrees
-        elif delta_angle < -self.direction_change_threshold: # Counter-clockwise movement
-            self.rotation_direction = "Counterclockwise"
-            self.total_accumulated_degrees -= abs(delta_angle) # Accumulate negative degrees (effectively)
-        else:
-            # If delta_angle is too small, consider it "None" to avoid jitter
-            self.rotation_direction = "None"
-
-        # Clamp total_accumulated_degrees to the defined maximum steering lock
-        self.total_accumulated_degrees = max(-self.max_degrees, min(self.max_degrees, self.total_accumulated_degrees))
-
-        # Update the previous_smoothed_angle for the next on_move event
+        self.previous_angular_velocity = delta_angle
         self.previous_smoothed_angle = current_smoothed_angle
 
-        # 6. Update vJoy Device Output
-        if self.vjoy_device:
-            # Scale total_accumulated_degrees from [-max_degrees, max_degrees] to vJoy's [MIN_VJOY_AXIS, MAX_VJOY_AXIS] range.
-            # The vJoy range is typically [0, 32767].
-            # Step 1: Normalize total_accumulated_degrees to [0, 1]
-            # Input range is self.max_degrees - (-self.max_degrees) = 2 * self.max_degrees
-            if (2 * self.max_degrees) == 0: # Avoid division by zero if max_degrees is 0
-                normalized_value = 0.5 # Center value
-            else:
-                normalized_value = (self.total_accumulated_degrees - (-self.max_degrees)) / (2 * self.max_degrees)
-
-            # Step 2: Scale normalized value [0,1] to [MIN_VJOY_AXIS, MAX_VJOY_AXIS]
-            axis_value = int(normalized_value * (MAX_VJOY_AXIS - MIN_VJOY_AXIS) + MIN_VJOY_AXIS)
-
-            # Ensure the calculated axis_value is strictly within vJoy's bounds as a failsafe.
-            axis_value = max(MIN_VJOY_AXIS, min(MAX_VJOY_AXIS, axis_value))
-            self.vjoy_device.set_axis(pyvjoy.HID_USAGE_X, axis_value)
-
-        # 7. Callback to GUI with updated data
+        # 6. Update vJoy Device Output; the device holds its value, so repeats are skipped
+        if self.vjoy_device and axis_value != self._last_axis_value:
+            self.vjoy_device.set_axis(self._hid_x, axis_value)
+            self._last_axis_value = axis_value
+
+        # 7. Callback to GUI with updated data: the compute_step tuple as is (see SteeringUpdate).
+        # The GUI's latest-wins slot drops stale steps, so the final position is always the one shown.
         if self.app_callback:
-            gui_data = {
-                "offset": self.current_offset,
-                "raw_angle": self.current_raw_angle, # Instantaneous angle of mouse
-                "smoothed_angle": current_smoothed_angle, # Smoothed angle of mouse
-                "total_accumulated_degrees": self.total_accumulated_degrees, # The "steering wheel" angle
-                "rotation_direction": self.rotation_direction,
-                "angular_velocity": self.angular_velocity,
-                "angular_acceleration": self.angular_acceleration,
-                "vjoy_axis_value": axis_value if self.vjoy_device else CENTER_VJOY_AXIS # Current vJoy output
-            }
-            self.app_callback("update_gui", gui_data)
+            self.app_callback("update_gui", step)
 
     def reset_steering_view(self):
         """
@@ -268,51 +253,60 @@ class SteeringLogic:
         self.angular_acceleration = 0.0
         # Recalculate previous_smoothed_angle based on current mouse position to avoid jump if steering continues
         try:
-            mouse_pos = pyvjoy.utils.get_mouse_position()
-            self.previous_smoothed_angle = self._calculate_raw_angle(mouse_pos['x'], mouse_pos['y'])
-        except Exception as e: # If pynput listener is not active, get_mouse_position might fail
+            self.previous_smoothed_angle = self._calculate_raw_angle(*self._mouse_position())
+        except Exception as e: # The OS cursor query can fail, e.g. without a display
              print(f"Could not get mouse position for reset: {e}")
              # Fallback: use last known raw angle or 0
-             self.previous_smoothed_angle = self.current_raw_angle if self.angle_history else 0.0
-
-        self.angle_history.clear()
-        for _ in range(self.angle_history.maxlen):
-            self.angle_history.append(self.previous_smoothed_angle)
+             self.previous_smoothed_angle = self.current_raw_angle
 
-        if self.vjoy_device and self.is_steering: # Only send if steering, otherwise it's centered on stop
-            self.vjoy_device.set_axis(pyvjoy.HID_USAGE_X, CENTER_VJOY_AXIS)
-        elif self.vjoy_device and not self.is_steering: # If stopped, ensure it reflects centered state
-             self.vjoy_device.set_axis(pyvjoy.HID_USAGE_X, CENTER_VJOY_AXIS)
+        # Center the axis, unless the last value written already was the center
+        if self.vjoy_device and self._last_axis_value != CENTER_VJOY_AXIS:
+            self.vjoy_device.set_axis(self._hid_x, CENTER_VJOY_AXIS)
+        self._last_axis_value = CENTER_VJOY_AXIS
 
 
         print("Steering view reset.")
         if self.app_callback:
              # Update GUI immediately after reset
-            gui_data = {
-                "offset": self.current_offset, # May not be 0 if mouse not physically centered
-                "raw_angle": self.current_raw_angle,
-                "smoothed_angle": self.previous_smoothed_angle,
-                "total_accumulated_degrees": self.total_accumulated_degrees,
-                "rotation_direction": "None",
-                "angular_velocity": self.angular_velocity,
-                "angular_acceleration": self.angular_acceleration,
-                "vjoy_axis_value": CENTER_VJOY_AXIS
-            }
-            self.app_callback("update_gui", gui_data)
+            self.app_callback("update_gui", self.get_current_update())
             self.app_callback("status", "View Recentered")
 
 
     def update_sensitivity(self, new_sensitivity):
         """Updates the steering sensitivity."""
         self.sensitivity = float(new_sensitivity)
+        # Higher sensitivity weights new samples more, i.e. less smoothing and a quicker response
+        self._alpha = min(1.0, EMA_ALPHA * self.sensitivity)
         # Note: Sensitivity's direct impact on angle accumulation (1:1 mapping) is currently minimal.
         # It could be used to scale delta_angle before accumulation if a non-linear response is desired:
         # e.g., self.total_accumulated_degrees += abs(delta_angle * self.sensitivity_factor)
-        # For now, it's primarily a placeholder or for future more complex sensitivity models.
         print(f"Sensitivity updated to: {self.sensitivity}")
         if self.app_callback:
             self.app_callback("status", f"Sensitivity: {self.sensitivity}")
 
+    def get_current_update(self):
+        """Returns a SteeringUpdate snapshot of the current state without a mouse event (init, recenter)."""
+        return SteeringUpdate(
+            offset_sq=self._offset_sq, # May not be 0 if mouse not physically centered
+            raw_angle=self.current_raw_angle,
+            smoothed_angle=self.previous_smoothed_angle,
+            angular_velocity=self.angular_velocity,
+            angular_acceleration=self.angular_acceleration,
+            total_accumulated_degrees=self.total_accumulated_degrees,
+            vjoy_axis_value=CENTER_VJOY_AXIS,
+            direction_code=0,
+        )
+
+    @property
+    def current_offset(self):
+        """Distance of mouse from center; computed on demand, as only the GUI displays it."""
+        return math.sqrt(self._offset_sq)
+
+    @property
+    def rotation_direction(self):
+        """"Clockwise", "Counterclockwise", or "None" for the latest mouse event."""
+        return DIRECTION_NAMES[self._direction_code]
+
     def get_status(self):
         """Returns a dictionary of the current steering logic status, mainly for GUI initialization."""
         # Added vjoy_status_text for direct use by GUI if needed at init
@@ -335,6 +329,10 @@ class SteeringLogic:
             # Other values are sent via update_gui callback
         }
 
+    def wait_until_stopped(self, timeout=None):
+        """Blocks until steering is stopped or 'timeout' seconds pass; returns True if stopped."""
+        return self._stop_event.wait(timeout)
+
     def close(self):
         """Cleans up resources, particularly stopping the mouse listener and centering vJoy."""
         self.stop_steering() # Ensure listener is stopped and vJoy centered
@@ -347,13 +345,14 @@ if __name__ == "__main__":
     def dummy_gui_callback_cli(event_type, data):
         """A simple CLI callback for testing SteeringLogic without the full GUI."""
         if event_type == "update_gui":
+            data = SteeringUpdate._make(data) # Plain compute_step tuple while steering
             print(
-                f"Offset: {data['offset']:.2f}, "
-                f"Accumulated: {data['total_accumulated_degrees']:.2f}°, "
-                f"Dir: {data['rotation_direction']}, "
-                f"Vel: {data['angular_velocity']:.2f}°/ev, "
-                f"Acc: {data['angular_acceleration']:.2f}°/ev² "
-                f"VJoy: {data['vjoy_axis_value']}"
+                f"Offset: {math.sqrt(data.offset_sq):.2f}, "
+                f"Accumulated: {data.total_accumulated_degrees:.2f}°, "
+                f"Dir: {DIRECTION_NAMES[data.direction_code]}, "
+                f"Vel: {data.angular_velocity:.2f}°/ev, "
+                f"Acc: {data.angular_acceleration:.2f}°/ev² "
+                f"VJoy: {data.vjoy_axis_value}"
             )
         elif event_type == "status":
             print(f"Logic Status: {data}")
@@ -390,8 +389,10 @@ if __name__ == "__main__":
         logic_cli.start_steering()
 
         try:
-            while True:
-                time.sleep(1)
+            # Sleep on the stop event rather than polling. The timeout only keeps Ctrl+C
+            # responsive on Windows, where an untimed wait cannot be interrupted.
+            while not logic_cli.wait_until_stopped(timeout=1.0):
+                pass
         except KeyboardInterrupt:
             print("\nStopping steering (CLI test)...")
         finally:
@@ -399,5 +400,3 @@ if __name__ == "__main__":
     else:
         print("Could not run CLI test: vJoy device not initialized or error during setup.")
         logic_cli.close() # Ensure cleanup even if not started.
-
-```